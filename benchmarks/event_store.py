@@ -0,0 +1,136 @@
+"""Benchmark the object and columnar event paths of the calendar handler.
+
+Run from the repository root:
+
+    python -m benchmarks.event_store
+
+For 1k, 10k and 100k raw events spread over 4 calendars, it measures the
+first process of a fetched response, a refresh of the cached response and
+the memory held by each path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import random
+import tempfile
+from time import perf_counter
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.calendar_events import calendar_handler
+from custom_components.calendar_events.calendar_handler import CalendarHandler
+from custom_components.calendar_events.const import (
+    CONF_DAYS_AHEAD,
+    CONF_MAX_EVENTS,
+    CONF_REMOVE_RECURRING_EVENTS,
+    DATA_FETCH_CACHE,
+    DOMAIN,
+)
+from custom_components.calendar_events.fetch_cache import CalendarFetchCache
+
+CALENDARS = 4
+SIZES = (1000, 10000, 100000)
+REFRESHES = 20
+OPTIONS = {
+    CONF_DAYS_AHEAD: 999,
+    CONF_MAX_EVENTS: 20,
+    CONF_REMOVE_RECURRING_EVENTS: True,
+}
+
+
+# ------------------------------------------------------
+def create_raw_events(size: int) -> dict[str, list[dict[str, Any]]]:
+    """Create shuffled raw events spread over the calendars."""
+
+    now = dt_util.now().replace(second=0, microsecond=0)
+    raw_events: dict[str, list[dict[str, Any]]] = {}
+
+    for calendar in range(CALENDARS):
+        events: list[dict[str, Any]] = []
+
+        for _ in range(size // CALENDARS):
+            start = now + timedelta(minutes=random.randint(-1440, 999 * 1440))
+            events.append(
+                {
+                    "start": start.isoformat(),
+                    "end": (
+                        start + timedelta(minutes=random.randint(15, 240))
+                    ).isoformat(),
+                    "summary": f"Event {random.randint(0, 50)}",
+                    "description": "",
+                    "location": "",
+                }
+            )
+
+        random.shuffle(events)
+        raw_events[f"calendar.calendar_{calendar}"] = events
+
+    return raw_events
+
+
+# ------------------------------------------------------
+def run_path(
+    hass: HomeAssistant,
+    raw_events: dict[str, list[dict[str, Any]]],
+    columnar_min_events: int,
+) -> tuple[float, float, float]:
+    """Measure first process, cached refresh and memory of one path."""
+
+    with patch.object(calendar_handler, "COLUMNAR_MIN_EVENTS", columnar_min_events):
+        handler = CalendarHandler(hass, None, dict(OPTIONS))
+        handler.raw_events = raw_events
+
+        start: float = perf_counter()
+        handler.process_calendar_events()
+        first: float = perf_counter() - start
+
+        start = perf_counter()
+
+        for _ in range(REFRESHES):
+            handler.process_calendar_events()
+
+        refresh: float = (perf_counter() - start) / REFRESHES
+
+        # Measured apart, tracing slows down every allocation
+        handler = CalendarHandler(hass, None, dict(OPTIONS))
+        handler.raw_events = raw_events
+        tracemalloc.start()
+        handler.process_calendar_events()
+        memory: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    return first * 1000, refresh * 1000, memory / 1024 / 1024
+
+
+# ------------------------------------------------------
+async def main() -> None:
+    """Run the benchmark."""
+
+    random.seed(0)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[DOMAIN] = {DATA_FETCH_CACHE: CalendarFetchCache(hass)}
+
+        print(f"{'events':>7} {'path':>8} {'first ms':>9} {'refresh ms':>11} {'MB':>6}")
+
+        for size in SIZES:
+            raw_events = create_raw_events(size)
+
+            for path, columnar_min_events in (("object", size + 1), ("columnar", 0)):
+                first, refresh, memory = run_path(hass, raw_events, columnar_min_events)
+                print(
+                    f"{size:>7} {path:>8} {first:>9.1f} {refresh:>11.2f} {memory:>6.1f}"
+                )
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
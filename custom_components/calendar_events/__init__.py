@@ -5,29 +5,56 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .calendar_handler import CalendarHandler
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_CALENDAR_ENTITY_IDS,
+    DATA_FETCH_CACHE,
+    DOMAIN,
+    IN_PLACE_OPTIONS,
+    LOGGER,
+)
+from .fetch_cache import CalendarFetchCache
+from .range_cache import CalendarRangeCache
+from .refresh_gate import RefreshGate
+from .snapshot_store import SnapshotStore
 
 
 # ------------------------------------------------------------------
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up State updates from a config entry."""
 
+    hass.data.setdefault(DOMAIN, {})
+
+    if DATA_FETCH_CACHE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_FETCH_CACHE] = CalendarFetchCache(hass)
+
+    calendar_entities: list[str] = er.async_validate_entity_ids(
+        er.async_get(hass), entry.options[CONF_CALENDAR_ENTITY_IDS]
+    )
     calendar_handler: CalendarHandler = CalendarHandler(
         hass, entry, entry.options.copy()
     )
 
+    snapshot_store: SnapshotStore = SnapshotStore(hass, entry.entry_id)
+    await snapshot_store.async_load()
+    calendar_handler.restore_events(snapshot_store.events)
+
     coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
         hass,
         LOGGER,
         name=DOMAIN,
     )
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    hass.data[DOMAIN][entry.entry_id] = {
+        "calendar_entities": calendar_entities,
         "calendar_handler": calendar_handler,
         "coordinator": coordinator,
+        "refresh_gate": RefreshGate(hass, coordinator, calendar_handler),
+        "range_cache": CalendarRangeCache(calendar_handler, calendar_entities),
+        "snapshot_store": snapshot_store,
     }
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -48,6 +75,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
 
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the snapshot of a removed config entry."""
+
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+
+
 # ------------------------------------------------------------------
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
@@ -60,6 +94,20 @@ async def update_listener(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Apply in place options without reload, reload on other changes."""
+
+    calendar_handler: CalendarHandler = hass.data[DOMAIN][config_entry.entry_id][
+        "calendar_handler"
+    ]
+    changed_options: set[str] = {
+        key
+        for key in config_entry.options.keys() | calendar_handler.entry_options.keys()
+        if config_entry.options.get(key) != calendar_handler.entry_options.get(key)
+    }
+
+    if changed_options <= IN_PLACE_OPTIONS:
+        calendar_handler.async_update_options(config_entry.options)
+        await hass.data[DOMAIN][config_entry.entry_id]["refresh_gate"].async_refresh()
+        return
 
     await hass.config_entries.async_reload(config_entry.entry_id)
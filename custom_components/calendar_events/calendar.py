@@ -12,6 +12,8 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .calendar_handler import CalendarHandler
 from .const import DOMAIN
+from .event_index import create_calendar_event
+from .range_cache import CalendarRangeCache
 
 
 # ------------------------------------------------------
@@ -46,6 +48,10 @@ class EventsCalendar(CalendarEntity):
         self.calendar_handler: CalendarHandler = hass.data[DOMAIN][entry.entry_id][
             "calendar_handler"
         ]
+        self.range_cache: CalendarRangeCache = hass.data[DOMAIN][entry.entry_id][
+            "range_cache"
+        ]
+        self.next_event: tuple[tuple, CalendarEvent] | None = None
 
     # ------------------------------------------------------
     @property
@@ -78,26 +84,16 @@ class EventsCalendar(CalendarEntity):
         if len(self.calendar_handler.events) == 0:
             return None
 
-        event = self.calendar_handler.events[0]
+        key: tuple = self.calendar_handler.events[0].identity_key
 
-        if event.all_day:
-            return CalendarEvent(
-                summary=event.summary,
-                description=event.description,
-                location=event.location,
-                start=datetime.date.fromisoformat(event.start),
-                end=datetime.date.fromisoformat(event.end),
+        # Reused while the next event is unchanged
+        if self.next_event is None or self.next_event[0] != key:
+            self.next_event = (
+                key,
+                create_calendar_event(self.calendar_handler.events[0]),
             )
 
-        return CalendarEvent(
-            summary=event.summary,
-            description=event.description,
-            location=event.location,
-            start=datetime.datetime.fromisoformat(event.start),
-            end=datetime.datetime.fromisoformat(event.end),
-        )
-
-        return None
+        return self.next_event[1]
 
     # ------------------------------------------------------
     async def async_get_events(
@@ -108,43 +104,7 @@ class EventsCalendar(CalendarEntity):
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
 
-        events: list[CalendarEvent] = []
-
-        for tmp_event in self.calendar_handler.events:
-            if start_date > datetime.datetime.fromisoformat(tmp_event.start).replace(
-                tzinfo=start_date.tzinfo
-            ):
-                continue
-            if end_date < datetime.datetime.fromisoformat(tmp_event.end).replace(
-                tzinfo=start_date.tzinfo
-            ):
-                continue
-
-            if tmp_event.all_day:
-                events.append(
-                    CalendarEvent(
-                        summary=tmp_event.summary,
-                        description=tmp_event.description,
-                        location=tmp_event.location,
-                        start=datetime.date.fromisoformat(tmp_event.start),
-                        end=datetime.date.fromisoformat(tmp_event.end),
-                    )
-                )
-            else:
-                events.append(
-                    CalendarEvent(
-                        summary=tmp_event.summary,
-                        description=tmp_event.description,
-                        location=tmp_event.location,
-                        start=datetime.datetime.fromisoformat(tmp_event.start).replace(
-                            tzinfo=start_date.tzinfo
-                        ),
-                        end=datetime.datetime.fromisoformat(tmp_event.end).replace(
-                            tzinfo=start_date.tzinfo
-                        ),
-                    )
-                )
-        return events
+        return await self.range_cache.async_get_events(start_date, end_date)
 
     # ------------------------------------------------------
     async def async_added_to_hass(self):
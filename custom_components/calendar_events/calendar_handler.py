@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import partial
+from time import monotonic
 from typing import Any
 
-from arrow.locales import get_locale
-from babel.dates import format_date, format_time, format_timedelta, get_datetime_format
-
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import issue_registry as ir
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
+from homeassistant.util import dt as dt_util
 
+from .columnar_store import ColumnarEvents
 from .const import (
+    ADAPTIVE_FETCH_GROWTH,
+    ADAPTIVE_FETCH_MIN_WINDOW,
+    COLUMNAR_MIN_EVENTS,
+    CONF_ADAPTIVE_FETCH,
     CONF_DAYS_AHEAD,
+    CONF_FETCH_CACHE_TTL,
+    CONF_FETCH_INTERVAL,
     CONF_FORMAT_LANGUAGE,
+    CONF_INCREMENTAL_FETCH,
     CONF_MAX_EVENTS,
     CONF_MD_HEADER_TEMPLATE,
     CONF_MD_ITEM_TEMPLATE,
@@ -27,41 +33,191 @@ from .const import (
     CONF_SHOW_END_DATE,
     CONF_SHOW_EVENT_AS_TIME_TO,
     CONF_SHOW_SUMMARY,
+    DATA_FETCH_CACHE,
     DOMAIN,
     DOMAIN_NAME,
+    INCREMENTAL_FETCH_RESYNC_INTERVAL,
     LOGGER,
+    MARKDOWN_MAX_SIZE,
+    RELATIVE_TIME_MIN_INTERVAL,
     TRANSLATION_KEY_TEMPLATE_ERROR,
 )
+from .datetime_formatter import DateTimeFormatter, async_get_formatter
+from .event_index import get_epoch_key, parse_event_datetime
+from .event_pipeline import (
+    EventStage,
+    filter_window,
+    limit,
+    merge_by_start,
+    remove_recurring_events,
+    run_stages,
+)
+from .fetch_cache import CalendarFetchCache, FetchExtension
+from .relative_time import get_seconds
+
+
+# ------------------------------------------------------------------
+def replace_markdown_tags(txt: str) -> str:
+    """Replace markdown tags."""
+
+    return txt.replace(".", "\\.").replace("-", "\\-").replace("+", "\\+")
+
+
+# ------------------------------------------------------
+def get_calendar_name(calendar_entity: str) -> str:
+    """Get calendar display name from calendar entity id."""
+
+    return calendar_entity.replace("calendar.", "").replace("_", " ").capitalize()
 
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     """Calendar event."""
 
-    def __init__(
-        self,
-        calendar: str,
-        start: str,
-        end: str,
-        summary: str,
-        description: str,
-        location: str,
-    ) -> None:
-        "Init."
+    calendar: str
+    start: datetime
+    end: datetime
+    all_day: bool
+    summary: str
+    description: str
+    location: str
+    formatted_start: str = ""
+    formatted_end: str = ""
+    formatted_event_time: str = ""
+    formatted_event: str = ""
+    start_key: int = field(init=False, repr=False, compare=False)
+    end_key: int = field(init=False, repr=False, compare=False)
 
-        self.calendar: str = calendar
-        self.start: str = start
-        self.end: str = end
-        self.all_day: bool = False
-        self.summary: str = summary
-        self.description: str = description
-        self.location: str = location
-        self.formatted_start: str = ""
-        self.formatted_end: str = ""
-        self.formatted_event_time: str = ""
-        self.formatted_event: str = ""
+    # ------------------------------------------------------
+    def __post_init__(self) -> None:
+        """Create the epoch keys used for ordering and window filtering."""
+
+        self.start_key = get_epoch_key(self.start)
+        self.end_key = get_epoch_key(self.end)
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_response(cls, calendar: str, event: dict[str, Any]) -> CalendarEvent:
+        """Create event from a calendar.get_events response item."""
+
+        return cls(
+            calendar,
+            parse_event_datetime(event["start"]),
+            parse_event_datetime(event["end"]),
+            len(event["start"]) == 10,
+            event.get("summary", ""),
+            event.get("description", ""),
+            event.get("location", ""),
+        )
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_dict(cls, event: dict[str, Any]) -> CalendarEvent:
+        """Create event from a dict created by as_dict."""
+
+        return cls(
+            event["calendar"],
+            parse_event_datetime(event["start"]),
+            parse_event_datetime(event["end"]),
+            event["all_day"],
+            event["summary"],
+            event["description"],
+            event["location"],
+            event["formatted_start"],
+            event["formatted_end"],
+            event["formatted_event_time"],
+            event["formatted_event"],
+        )
+
+    # ------------------------------------------------------
+    @property
+    def recurring_key(self) -> tuple:
+        """Key shared by the events of a recurring series.
+
+        Events belong to the same series when calendar, summary, description
+        and the time of day of start and end are equal.
+        """
+
+        return (
+            self.calendar,
+            self.summary,
+            self.description,
+            self.start.time(),
+            self.end.time(),
+        )
+
+    # ------------------------------------------------------
+    @property
+    def identity_key(self) -> tuple:
+        """Key identifying the event across fetches."""
+
+        return (
+            self.start,
+            self.end,
+            self.all_day,
+            self.summary,
+            self.description,
+            self.location,
+        )
+
+    # ------------------------------------------------------
+    @property
+    def render_key(self) -> tuple:
+        """Key that changes when the event or its formatted fields change."""
+
+        return (
+            self.calendar,
+            self.start,
+            self.end,
+            self.all_day,
+            self.summary,
+            self.description,
+            self.location,
+            self.formatted_start,
+            self.formatted_end,
+            self.formatted_event_time,
+            self.formatted_event,
+        )
+
+    # ------------------------------------------------------
+    @property
+    def start_iso(self) -> str:
+        """Start as iso string, date only for all day events."""
+
+        if self.all_day:
+            return self.start.date().isoformat()
+
+        return self.start.isoformat()
+
+    # ------------------------------------------------------
+    @property
+    def end_iso(self) -> str:
+        """End as iso string, date only for all day events."""
+
+        if self.all_day:
+            return self.end.date().isoformat()
+
+        return self.end.isoformat()
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        """Return event as dict."""
+
+        return {
+            "calendar": self.calendar,
+            "start": self.start_iso,
+            "end": self.end_iso,
+            "all_day": self.all_day,
+            "summary": self.summary,
+            "description": self.description,
+            "location": self.location,
+            "formatted_start": self.formatted_start,
+            "formatted_end": self.formatted_end,
+            "formatted_event_time": self.formatted_event_time,
+            "formatted_event": self.formatted_event,
+        }
 
 
 # ------------------------------------------------------
@@ -80,14 +236,39 @@ class CalendarHandler:
         self.hass: HomeAssistant = hass
         self.entry: ConfigEntry = entry
         self.entry_options: dict[str, Any] = entry_options
+        self.calendar_entities: list[str] = []
         self.events: list[CalendarEvent] = []
+        self.formatter: DateTimeFormatter | None = None
         self.language: str = self.entry_options.get(
             CONF_FORMAT_LANGUAGE, self.hass.config.language
         )
 
         self.last_error_template: str = ""
         self.last_error_txt_template: str = ""
-        self.next_update: datetime = datetime.now()
+        self.next_update: datetime = dt_util.now()
+        self.raw_events: dict[str, list[dict[str, Any]]] = {}
+        self.parsed_events: dict[
+            str, tuple[list[dict[str, Any]], list[CalendarEvent]]
+        ] = {}
+        self.columnar_events: dict[str, ColumnarEvents] = {}
+        self.last_fetch: datetime | None = None
+        self.fetch_window: timedelta | None = None
+        self.adaptive_window: timedelta | None = None
+        self.fetch_count: int = 0
+        self.fetch_duration: float = 0
+        self.process_duration: float = 0
+        self.format_duration: float = 0
+        self.suppressed_writes: int = 0
+        self.fetch_cache: CalendarFetchCache = hass.data[DOMAIN][DATA_FETCH_CACHE]
+
+        self.md_header_template: Template | None = None
+        self.md_item_template: Template | None = None
+        self.md_variables_only: dict[Template, bool] = {}
+        self.md_entities: set[str] = set()
+        self.md_values: dict[tuple, dict[str, Any]] = {}
+        self.md_rendered: dict[tuple, Any] = {}
+        self.event_dicts: dict[tuple, dict[str, Any]] = {}
+        self.create_templates()
 
     # ------------------------------------------------------
     async def get_process_calendar_events(
@@ -95,224 +276,479 @@ class CalendarHandler:
         calendar_entities: list[str],
         force_update: bool = False,
     ) -> None:
-        """Process calendar events."""
-
-        if force_update or self.next_update < datetime.now():
-            self.events = []
-
-            try:
-                tmp_events: dict = await self.hass.services.async_call(
-                    "calendar",
-                    "get_events",
-                    service_data={
-                        ATTR_ENTITY_ID: calendar_entities,
-                        "end_date_time": (
-                            datetime.now()
-                            + timedelta(
-                                days=self.entry_options.get(CONF_DAYS_AHEAD, 30)
-                            )
-                        ).isoformat(),
-                        "start_date_time": datetime.now().isoformat(),
-                    },
-                    blocking=True,
-                    return_response=True,
+        """Process calendar events, fetching when the fetch interval has passed."""
+
+        self.calendar_entities = calendar_entities
+
+        if force_update or self.next_update <= dt_util.now():
+            await self.async_fetch_calendar_events(calendar_entities)
+
+        self.process_calendar_events()
+
+        if self.is_fetch_window_short():
+            # Fewer than max events left in the fetched window, widen it
+            await self.async_fetch_calendar_events(calendar_entities)
+            self.process_calendar_events()
+
+    # ------------------------------------------------------
+    async def async_fetch_calendar_events(self, calendar_entities: list[str]) -> None:
+        """Fetch raw calendar events."""
+
+        fetch_start: float = monotonic()
+        fetch_interval: timedelta = timedelta(
+            minutes=self.entry_options.get(CONF_FETCH_INTERVAL, 5)
+        )
+        days_ahead: timedelta = timedelta(
+            days=self.entry_options.get(CONF_DAYS_AHEAD, 30)
+        )
+        start: datetime = dt_util.now()
+
+        try:
+            if self.entry_options.get(CONF_ADAPTIVE_FETCH, False):
+                await self.async_fetch_adaptive_window(
+                    calendar_entities, start, days_ahead, fetch_interval
                 )
-            # except (ServiceValidationError, ServiceNotFound, vol.Invalid) as err:
-            except Exception as err:  # noqa: BLE001
-                LOGGER.error(err)
+            else:
+                # Fetch past the window, so events moving into the window
+                # before the next fetch are already known.
+                self.raw_events = await self.fetch_cache.async_get_events(
+                    calendar_entities,
+                    start,
+                    start + days_ahead + fetch_interval,
+                    timedelta(seconds=self.entry_options.get(CONF_FETCH_CACHE_TTL, 60)),
+                    self.get_resync_interval(),
+                )
+        # except (ServiceValidationError, ServiceNotFound, vol.Invalid) as err:
+        except Exception as err:  # noqa: BLE001
+            LOGGER.error(err)
+            return
+        finally:
+            self.fetch_duration = monotonic() - fetch_start
+            self.next_update = start + fetch_interval
+
+        self.fetch_count += 1
+        self.last_fetch = start
+
+    # ------------------------------------------------------
+    async def async_fetch_adaptive_window(
+        self,
+        calendar_entities: list[str],
+        start: datetime,
+        days_ahead: timedelta,
+        fetch_interval: timedelta,
+    ) -> None:
+        """Fetch the shortest window holding the events to display."""
+
+        max_events: int = int(self.entry_options.get(CONF_MAX_EVENTS, 5))
+        remove_recurring: bool = self.entry_options.get(
+            CONF_REMOVE_RECURRING_EVENTS, True
+        )
+        window: timedelta = min(
+            self.adaptive_window or ADAPTIVE_FETCH_MIN_WINDOW, days_ahead
+        )
+
+        while True:
+            self.raw_events = await self.fetch_cache.async_get_events(
+                calendar_entities,
+                start,
+                start + window + fetch_interval,
+                timedelta(seconds=self.entry_options.get(CONF_FETCH_CACHE_TTL, 60)),
+                self.get_resync_interval(),
+            )
+            self.fetch_window = window
+            events: list[CalendarEvent] = self.select_events(
+                start, start + window, max_events, remove_recurring
+            )
+
+            if len(events) >= max_events:
+                break
+
+            if window >= days_ahead:
                 return
 
-            for key in tmp_events:
-                for event in tmp_events[key]["events"]:
-                    self.events.append(
-                        CalendarEvent(
-                            str(key)
-                            .replace("calendar.", "")
-                            .replace("_", " ")
-                            .capitalize(),
-                            event["start"],
-                            event["end"],
-                            event.get("summary", ""),
-                            event.get("description", ""),
-                            event.get("location", ""),
-                        )
-                    )
+            window = min(window * ADAPTIVE_FETCH_GROWTH, days_ahead)
 
-            if self.entry_options.get(CONF_REMOVE_RECURRING_EVENTS, True):
-                self.remove_recurring_events()
+        if not all(
+            self.fetch_cache.is_available(calendar_entity)
+            for calendar_entity in calendar_entities
+        ):
+            return
+
+        while (
+            window / ADAPTIVE_FETCH_GROWTH >= ADAPTIVE_FETCH_MIN_WINDOW
+            and events[-1].start < start + window / ADAPTIVE_FETCH_GROWTH
+        ):
+            window /= ADAPTIVE_FETCH_GROWTH
 
-            self.events.sort(key=lambda x: x.start)
-            self.events = self.events[: int(self.entry_options.get(CONF_MAX_EVENTS, 5))]
-            self.next_update = datetime.now() + timedelta(minutes=5)
+        self.adaptive_window = window
 
     # ------------------------------------------------------
-    def remove_recurring_events(self) -> None:
-        """Remove recurring events."""
+    def get_resync_interval(self) -> timedelta | None:
+        """Get the max time between full fetches, None if not incremental."""
 
-        index: int = 0
+        if self.entry_options.get(CONF_INCREMENTAL_FETCH, False):
+            return INCREMENTAL_FETCH_RESYNC_INTERVAL
 
-        while index < (len(self.events) - 1):
-            for index2, _ in reversed(list(enumerate(self.events))):
-                if index2 <= index:
-                    break
-                if (
-                    self.events[index].calendar == self.events[index2].calendar
-                    and self.events[index].summary == self.events[index2].summary
-                    and self.events[index].description
-                    == self.events[index2].description
-                    and datetime.fromisoformat(self.events[index].start).time()
-                    == datetime.fromisoformat(self.events[index2].start).time()
-                    and datetime.fromisoformat(self.events[index].end).time()
-                    == datetime.fromisoformat(self.events[index2].end).time()
-                ):
-                    del self.events[index2]
-            index += 1
+        return None
+
+    # ------------------------------------------------------
+    def is_fetch_window_short(self) -> bool:
+        """Check if the adaptive fetch window no longer holds max events."""
+
+        return (
+            self.fetch_window is not None
+            and self.entry_options.get(CONF_ADAPTIVE_FETCH, False)
+            and len(self.events) < int(self.entry_options.get(CONF_MAX_EVENTS, 5))
+            and self.fetch_window
+            < timedelta(days=self.entry_options.get(CONF_DAYS_AHEAD, 30))
+        )
+
+    # ------------------------------------------------------
+    def restore_events(self, events: list[CalendarEvent]) -> None:
+        """Restore events from a snapshot, until the first refresh."""
+
+        now_key: int = get_epoch_key(dt_util.now())
+        self.events = [event for event in events if event.end_key > now_key]
+
+    # ------------------------------------------------------
+    def process_calendar_events(self) -> None:
+        """Process raw calendar events into the events to display."""
+
+        process_start: float = monotonic()
+        start: datetime = dt_util.now()
+        self.parsed_events = {
+            key: parsed
+            for key, parsed in self.parsed_events.items()
+            if key in self.raw_events
+        }
+        self.columnar_events = {
+            key: store
+            for key, store in self.columnar_events.items()
+            if key in self.raw_events
+        }
+
+        self.events = self.select_events(
+            start,
+            start + timedelta(days=self.entry_options.get(CONF_DAYS_AHEAD, 30)),
+            int(self.entry_options.get(CONF_MAX_EVENTS, 5)),
+            self.entry_options.get(CONF_REMOVE_RECURRING_EVENTS, True),
+        )
+        self.process_duration = monotonic() - process_start
 
     # ------------------------------------------------------
-    async def async_format_datetime(
+    def select_events(
         self,
-        date_time: datetime,
-        date_only: bool = False,
-    ) -> str | None:
-        """Format datetime."""
-
-        date_str: str = await self.hass.async_add_executor_job(
-            partial(
-                format_date,
-                date=date_time,
-                format="medium",
-                locale=self.language,
+        start: datetime,
+        end: datetime,
+        max_events: int,
+        remove_recurring: bool,
+    ) -> list[CalendarEvent]:
+        """Select the events to display within start to end from raw events."""
+
+        columnar: bool = (
+            sum(len(events) for events in self.raw_events.values())
+            >= COLUMNAR_MIN_EVENTS
+        )
+
+        # Only one path keeps its records, so fewer than COLUMNAR_MIN_EVENTS
+        # parsed events are kept
+        if columnar:
+            self.parsed_events.clear()
+        else:
+            self.columnar_events.clear()
+
+        return list(
+            run_stages(
+                merge_by_start(
+                    self.iter_calendar_events(
+                        key,
+                        self.raw_events[key],
+                        start,
+                        end,
+                        remove_recurring,
+                        columnar,
+                    )
+                    for key in self.raw_events
+                ),
+                self.get_event_stages(max_events, remove_recurring),
             )
         )
 
-        if date_only:
-            return date_str
+    # ------------------------------------------------------
+    @callback
+    def async_invalidate(self) -> None:
+        """Fetch raw calendar events on the next refresh."""
 
-        dt_format = await self.hass.async_add_executor_job(
-            get_datetime_format, "medium", self.language
-        )
+        self.next_update = dt_util.now()
 
-        time_str: str = await self.hass.async_add_executor_job(
-            partial(
-                format_time,
-                time=date_time,
-                format="short",
-                locale=self.language,
+    # ------------------------------------------------------
+    def iter_calendar_events(
+        self,
+        calendar_entity: str,
+        events: list[dict[str, Any]],
+        start: datetime,
+        end: datetime,
+        remove_recurring: bool,
+        columnar: bool,
+    ) -> Iterator[CalendarEvent]:
+        """Iterate events from one calendar response within start to end."""
+
+        start_key: int = get_epoch_key(start)
+        end_key: int = get_epoch_key(end)
+
+        if columnar:
+            store: ColumnarEvents = self.get_columnar_events(calendar_entity, events)
+            return (
+                CalendarEvent.from_response(store.calendar, item)
+                for item in store.iter_items(start_key, end_key, remove_recurring)
             )
+
+        return filter_window(
+            iter(self.get_calendar_events(calendar_entity, events)),
+            start_key,
+            end_key,
+        )
+
+    # ------------------------------------------------------
+    def get_calendar_events(
+        self, calendar_entity: str, events: list[dict[str, Any]]
+    ) -> list[CalendarEvent]:
+        """Get the events of a calendar response ordered by start, parsed once."""
+
+        parsed: tuple[list[dict[str, Any]], list[CalendarEvent]] | None = (
+            self.parsed_events.get(calendar_entity)
         )
 
-        return dt_format.format(time_str, date_str)
+        if parsed is None or parsed[0] is not events:
+            calendar: str = get_calendar_name(calendar_entity)
+            extension: FetchExtension | None = self.fetch_cache.get_extension(
+                calendar_entity, events
+            )
+
+            if (
+                extension is not None
+                and parsed is not None
+                and extension.base is parsed[0]
+            ):
+                # Ended events are dropped and only the tail is parsed
+                calendar_events: list[CalendarEvent] = [
+                    event for event in parsed[1] if event.end_key > extension.start_key
+                ] + [
+                    CalendarEvent.from_response(calendar, item)
+                    for item in extension.tail
+                ]
+            else:
+                calendar_events = [
+                    CalendarEvent.from_response(calendar, item) for item in events
+                ]
+
+            parsed = (events, sorted(calendar_events, key=lambda x: x.start_key))
+            self.parsed_events[calendar_entity] = parsed
+
+        return parsed[1]
 
     # ------------------------------------------------------
-    async def async_format_event(self, event_num: int) -> str | None:
-        """Format event."""
+    def get_columnar_events(
+        self, calendar_entity: str, events: list[dict[str, Any]]
+    ) -> ColumnarEvents:
+        """Get the columnar store of a calendar response, built once."""
+
+        store: ColumnarEvents | None = self.columnar_events.get(calendar_entity)
 
-        if event_num < len(self.events):
-            tmp_event = self.events[event_num]
-            start_date: datetime = datetime.fromisoformat(tmp_event.start)
-            start_date_next: datetime = start_date + timedelta(days=1)
-            end_date: datetime = datetime.fromisoformat(tmp_event.end)
+        if store is None or store.events is not events:
+            extension: FetchExtension | None = self.fetch_cache.get_extension(
+                calendar_entity, events
+            )
 
             if (
-                start_date_next == end_date
-                and start_date.hour == 0
-                and start_date.minute == 0
-                and end_date.hour == 0
-                and end_date.minute == 0
+                extension is not None
+                and store is not None
+                and extension.base is store.events
             ):
-                tmp_event.all_day = True
-                tmp_event.formatted_start = await self.async_format_datetime(
-                    start_date, date_only=True
-                )
-                tmp_event.formatted_end = await self.async_format_datetime(
-                    end_date, date_only=True
-                )
+                store = store.extend(events, extension.start_key, extension.tail)
             else:
-                tmp_event.formatted_start = await self.async_format_datetime(start_date)
-                tmp_event.formatted_end = await self.async_format_datetime(end_date)
+                store = ColumnarEvents(get_calendar_name(calendar_entity), events)
 
-            diff: timedelta = start_date - datetime.now(start_date.tzinfo)
+            self.columnar_events[calendar_entity] = store
 
-            if tmp_event.all_day and diff.total_seconds() < 0:
-                formatted_event_str: str = (
-                    get_locale(self.language).timeframes.get("now", "now").capitalize()
-                )
+        return store
 
-            elif self.entry_options.get(CONF_SHOW_EVENT_AS_TIME_TO, False):
-                formatted_event_str: str = await self.hass.async_add_executor_job(
-                    partial(
-                        format_timedelta,
-                        delta=diff,
-                        add_direction=True,
-                        locale=self.language,
-                    )
+    # ------------------------------------------------------
+    def get_event_stages(
+        self, max_events: int, remove_recurring: bool
+    ) -> list[EventStage]:
+        """Get the stages applied to the merged events."""
+
+        stages: list[EventStage] = []
+
+        if remove_recurring:
+            stages.append(remove_recurring_events)
+
+        stages.append(limit(max_events))
+        return stages
+
+    # ------------------------------------------------------
+    def get_next_change(self, now: datetime) -> datetime | None:
+        """Get the next time a displayed value can change."""
+
+        next_change: datetime | None = None
+
+        if self.next_update > now:
+            next_change = self.next_update
+
+        if self.uses_time_or_states() and (
+            next_change is None or now + RELATIVE_TIME_MIN_INTERVAL < next_change
+        ):
+            next_change = now + RELATIVE_TIME_MIN_INTERVAL
+
+        for event in self.events:
+            for point in (event.start, event.end):
+                if point > now and (next_change is None or point < next_change):
+                    next_change = point
+
+        if self.formatter is not None and self.entry_options.get(
+            CONF_SHOW_EVENT_AS_TIME_TO, False
+        ):
+            min_relative_change: datetime = now + RELATIVE_TIME_MIN_INTERVAL
+
+            for event in self.events:
+                # Started all day events are shown as now
+                if event.all_day and event.start <= now:
+                    continue
+
+                relative_change: datetime = max(
+                    event.start
+                    - timedelta(
+                        seconds=self.formatter.relative_time.next_change(
+                            get_seconds(event.start - now)
+                        )
+                    ),
+                    min_relative_change,
                 )
 
-            else:
-                formatted_event_str = tmp_event.formatted_start
-                if (
-                    self.entry_options.get(CONF_SHOW_END_DATE, False)
-                    and not tmp_event.all_day
-                ):
-                    formatted_event_str = (
-                        formatted_event_str + " - " + tmp_event.formatted_end
-                    )
+                if next_change is None or relative_change < next_change:
+                    next_change = relative_change
 
-            tmp_event.formatted_event_time = formatted_event_str
+        return next_change
 
-            if self.entry_options.get(CONF_SHOW_SUMMARY, False):
-                formatted_event_str = tmp_event.summary + " : " + formatted_event_str
+    # ------------------------------------------------------
+    async def async_format_events(self) -> None:
+        """Format all events in one batch."""
 
-            tmp_event.formatted_event = formatted_event_str
-            self.events[event_num] = tmp_event
+        format_start: float = monotonic()
+        self.formatter = await async_get_formatter(self.hass, self.language)
+        now: datetime = dt_util.now()
 
-            return formatted_event_str
+        for event in self.events:
+            self.format_event(self.formatter, event, now)
 
-        return None
+        self.format_duration = monotonic() - format_start
+
+    # ------------------------------------------------------
+    def format_event(
+        self, formatter: DateTimeFormatter, event: CalendarEvent, now: datetime
+    ) -> None:
+        """Format event."""
+
+        if event.all_day:
+            event.formatted_start = formatter.format_date(event.start)
+            event.formatted_end = formatter.format_date(event.end)
+        else:
+            event.formatted_start = formatter.format_datetime(event.start)
+            event.formatted_end = formatter.format_datetime(event.end)
+
+        diff: timedelta = event.start - now
+
+        if event.all_day and diff.total_seconds() < 0:
+            formatted_event_str: str = formatter.now
+
+        elif self.entry_options.get(CONF_SHOW_EVENT_AS_TIME_TO, False):
+            formatted_event_str = formatter.format_timedelta(diff)
+
+        else:
+            formatted_event_str = event.formatted_start
+            if self.entry_options.get(CONF_SHOW_END_DATE, False) and not event.all_day:
+                formatted_event_str = formatted_event_str + " - " + event.formatted_end
+
+        event.formatted_event_time = formatted_event_str
+
+        if self.entry_options.get(CONF_SHOW_SUMMARY, False):
+            formatted_event_str = event.summary + " : " + formatted_event_str
+
+        event.formatted_event = formatted_event_str
 
     # ------------------------------------------------------------------
-    def create_markdown(self) -> str:
-        """Create markdown."""
+    @callback
+    def async_update_options(self, entry_options: Mapping[str, Any]) -> None:
+        """Apply changed in place options."""
+
+        self.entry_options.clear()
+        self.entry_options.update(entry_options)
+        self.language = self.entry_options.get(
+            CONF_FORMAT_LANGUAGE, self.hass.config.language
+        )
+        self.create_templates()
 
-        # ------------------------------------------------------------------
-        def replace_markdown_tags(txt: str) -> str:
-            """Replace markdown tags."""
+    # ------------------------------------------------------------------
+    def create_templates(self) -> None:
+        """Create markdown templates from the options."""
 
-            return txt.replace(".", "\\.").replace("-", "\\-").replace("+", "\\+")
+        self.md_header_template = None
 
-        try:
-            tmp_md: str = ""
-            values: dict[str, Any] = {}
+        if self.entry_options.get(CONF_MD_HEADER_TEMPLATE, "") != "":
+            self.md_header_template = Template(
+                str(self.entry_options.get(CONF_MD_HEADER_TEMPLATE, "")),
+                self.hass,
+            )
+
+        self.md_item_template = Template(
+            str(self.entry_options.get(CONF_MD_ITEM_TEMPLATE, "")),
+            self.hass,
+        )
+        self.md_variables_only = {}
+        self.md_entities = set()
+        self.md_values = {}
+        self.md_rendered = {}
+
+    # ------------------------------------------------------------------
+    def create_markdown(self) -> str:
+        """Create markdown, reusing output rendered for unchanged events."""
+
+        tmp_md: str = ""
+        value_template: Template | None = None
+        md_values: dict[tuple, dict[str, Any]] = {}
+        md_rendered: dict[tuple, Any] = {}
 
-            if self.entry_options.get(CONF_MD_HEADER_TEMPLATE, "") != "":
-                value_template: Template | None = Template(
-                    str(self.entry_options.get(CONF_MD_HEADER_TEMPLATE, "")),
-                    self.hass,
+        try:
+            if self.md_header_template is not None:
+                value_template = self.md_header_template
+                tmp_md = self.render_markdown_template(
+                    value_template, {}, ("header",), md_rendered
                 )
 
-                tmp_md = value_template.async_render({})
+            value_template = self.md_item_template
 
             for item in self.events:
-                value_template: Template | None = Template(
-                    str(self.entry_options.get(CONF_MD_ITEM_TEMPLATE, "")),
-                    self.hass,
+                key: tuple = item.render_key
+
+                if (values := self.md_values.get(key)) is None:
+                    values = self.create_markdown_values(item)
+
+                md_values[key] = values
+                rendered: str = self.render_markdown_template(
+                    value_template, values, key, md_rendered
                 )
-                values = {
-                    "calendar": replace_markdown_tags(item.calendar),
-                    "start": replace_markdown_tags(item.start),
-                    "end": replace_markdown_tags(item.end),
-                    "all_day": item.all_day,
-                    "summary": replace_markdown_tags(item.summary),
-                    "description": replace_markdown_tags(item.description),
-                    "location": replace_markdown_tags(item.location),
-                    "formatted_start": replace_markdown_tags(item.formatted_start),
-                    "formatted_end": replace_markdown_tags(item.formatted_end),
-                    "formatted_event": replace_markdown_tags(item.formatted_event),
-                    "formatted_event_time": replace_markdown_tags(
-                        item.formatted_event_time
-                    ),
-                }
-                tmp_md += value_template.async_render(values)
+
+                if len(tmp_md) + len(rendered) > MARKDOWN_MAX_SIZE:
+                    LOGGER.debug(
+                        "Markdown for %s truncated to %s of %s events",
+                        self.entry.title,
+                        len(md_values) - 1,
+                        len(self.events),
+                    )
+                    break
+
+                tmp_md += rendered
 
             tmp_md = tmp_md.replace("<br>", "\r")
 
@@ -321,8 +757,120 @@ class CalendarHandler:
                 str(e), value_template.template, TRANSLATION_KEY_TEMPLATE_ERROR
             )
 
+        self.md_values = md_values
+        self.md_rendered = md_rendered
+
         return tmp_md
 
+    # ------------------------------------------------------------------
+    def create_events_attribute(self) -> list[dict[str, Any]]:
+        """Create the events attribute, reusing the dicts of unchanged events."""
+
+        event_dicts: dict[tuple, dict[str, Any]] = {}
+        events_attribute: list[dict[str, Any]] = []
+
+        for item in self.events:
+            key: tuple = item.render_key
+
+            if (event_dict := self.event_dicts.get(key)) is None:
+                event_dict = item.as_dict()
+
+            event_dicts[key] = event_dict
+            events_attribute.append(event_dict)
+
+        self.event_dicts = event_dicts
+
+        return events_attribute
+
+    # ------------------------------------------------------------------
+    def create_markdown_values(self, item: CalendarEvent) -> dict[str, Any]:
+        """Create markdown template values for an event."""
+
+        return {
+            "calendar": replace_markdown_tags(item.calendar),
+            "start": replace_markdown_tags(item.start_iso),
+            "end": replace_markdown_tags(item.end_iso),
+            "all_day": item.all_day,
+            "summary": replace_markdown_tags(item.summary),
+            "description": replace_markdown_tags(item.description),
+            "location": replace_markdown_tags(item.location),
+            "formatted_start": replace_markdown_tags(item.formatted_start),
+            "formatted_end": replace_markdown_tags(item.formatted_end),
+            "formatted_event": replace_markdown_tags(item.formatted_event),
+            "formatted_event_time": replace_markdown_tags(item.formatted_event_time),
+        }
+
+    # ------------------------------------------------------------------
+    def render_markdown_template(
+        self,
+        template: Template,
+        values: dict[str, Any],
+        key: tuple,
+        md_rendered: dict[tuple, Any],
+    ) -> Any:
+        """Render markdown template, reusing output rendered for the same key."""
+
+        if key in self.md_rendered:
+            rendered: Any = self.md_rendered[key]
+        else:
+            rendered = template.async_render(values)
+
+            if not self.uses_variables_only(template, values):
+                return rendered
+
+        md_rendered[key] = rendered
+
+        return rendered
+
+    # ------------------------------------------------------------------
+    def uses_variables_only(self, template: Template, values: dict[str, Any]) -> bool:
+        """Check if template output only depends on the template variables.
+
+        Output of templates using states or time can not be reused.
+        """
+
+        if (variables_only := self.md_variables_only.get(template)) is None:
+            info: RenderInfo = template.async_render_to_info(values)
+            variables_only = info.exception is None and not (
+                info.has_time
+                or info.all_states
+                or info.all_states_lifecycle
+                or info.entities
+                or info.domains
+                or info.domains_lifecycle
+            )
+            self.md_variables_only[template] = variables_only
+            self.md_entities.update(info.entities)
+
+        return variables_only
+
+    # ------------------------------------------------------------------
+    def uses_time_or_states(self) -> bool:
+        """Check if markdown template output depends on time or states."""
+
+        return not all(self.md_variables_only.values())
+
+    # ------------------------------------------------------------------
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostics."""
+
+        return {
+            "events": len(self.events),
+            "raw_events": {
+                calendar_entity: len(events)
+                for calendar_entity, events in self.raw_events.items()
+            },
+            "last_fetch": self.last_fetch,
+            "next_fetch": self.next_update,
+            "fetch_window": self.fetch_window,
+            "adaptive_window": self.adaptive_window,
+            "fetch_count": self.fetch_count,
+            "fetch_duration": self.fetch_duration,
+            "process_duration": self.process_duration,
+            "format_duration": self.format_duration,
+            "suppressed_writes": self.suppressed_writes,
+        }
+
     # ------------------------------------------------------------------
     def create_issue_template(
         self,
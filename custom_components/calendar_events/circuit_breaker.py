@@ -0,0 +1,95 @@
+"""Circuit breaker for Calendar events helper."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+import random
+from typing import Any
+
+from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_MAX_BACKOFF,
+    CIRCUIT_BREAKER_MIN_BACKOFF,
+)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class BreakerState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Circuit breaker for one source calendar."""
+
+    state: BreakerState = BreakerState.CLOSED
+    failure_count: int = 0
+    open_count: int = 0
+    opened: datetime | None = None
+    retry_at: datetime | None = None
+
+    # ------------------------------------------------------
+    def allow_request(self, now: datetime) -> bool:
+        """Check if a request is allowed, a probe when the backoff elapsed."""
+
+        if self.state == BreakerState.CLOSED:
+            return True
+
+        if self.retry_at is not None and now >= self.retry_at:
+            self.state = BreakerState.HALF_OPEN
+            return True
+
+        return False
+
+    # ------------------------------------------------------
+    def record_success(self) -> None:
+        """Record a successful request."""
+
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.open_count = 0
+        self.opened = None
+        self.retry_at = None
+
+    # ------------------------------------------------------
+    def record_failure(self, now: datetime) -> bool:
+        """Record a failed request, return True when the breaker opened."""
+
+        self.failure_count += 1
+
+        if (
+            self.state == BreakerState.CLOSED
+            and self.failure_count < CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        ):
+            return False
+
+        self.open_count += 1
+        backoff: timedelta = min(
+            CIRCUIT_BREAKER_MIN_BACKOFF * 2 ** (self.open_count - 1),
+            CIRCUIT_BREAKER_MAX_BACKOFF,
+        )
+        self.state = BreakerState.OPEN
+        self.opened = now
+        self.retry_at = now + backoff * random.uniform(0.5, 1)
+        return True
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        """Circuit breaker as dict."""
+
+        return {
+            "state": self.state,
+            "failure_count": self.failure_count,
+            "open_count": self.open_count,
+            "opened": self.opened,
+            "retry_at": self.retry_at,
+        }
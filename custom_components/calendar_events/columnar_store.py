@@ -0,0 +1,189 @@
+"""Columnar event store for Calendar events helper."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from .event_index import get_epoch_key, parse_event_datetime
+
+COLUMNAR_CHUNK_SIZE = 64
+
+
+# ------------------------------------------------------
+def get_time_of_day(value: datetime) -> int:
+    """Microseconds since midnight of the wall time."""
+
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1000000 + value.microsecond
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ColumnarEvents:
+    """Columnar events of one calendar response."""
+
+    def __init__(
+        self,
+        calendar: str,
+        events: list[dict[str, Any]],
+        texts: dict[str, int] | None = None,
+    ) -> None:
+        """Init."""
+
+        self.calendar: str = calendar
+        self.events: list[dict[str, Any]] = events
+        self.texts: dict[str, int] = texts if texts is not None else {}
+
+        starts: list[datetime] = [
+            parse_event_datetime(item["start"]) for item in events
+        ]
+        ends: list[datetime] = [parse_event_datetime(item["end"]) for item in events]
+        start_keys = np.array([get_epoch_key(start) for start in starts], np.int64)
+
+        # Stable, so events starting together keep the response order
+        order = np.argsort(start_keys, kind="stable")
+        self.rows = order
+        self.starts = start_keys[order]
+        self.ends = np.array([get_epoch_key(end) for end in ends], np.int64)[order]
+        self.start_times = np.array(
+            [get_time_of_day(start) for start in starts], np.int64
+        )[order]
+        self.end_times = np.array([get_time_of_day(end) for end in ends], np.int64)[
+            order
+        ]
+        self.summaries = np.array(
+            [
+                self.texts.setdefault(item.get("summary", ""), len(self.texts))
+                for item in events
+            ],
+            np.int64,
+        )[order]
+        self.descriptions = np.array(
+            [
+                self.texts.setdefault(item.get("description", ""), len(self.texts))
+                for item in events
+            ],
+            np.int64,
+        )[order]
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        """Number of events."""
+
+        return len(self.events)
+
+    # ------------------------------------------------------
+    def extend(
+        self,
+        events: list[dict[str, Any]],
+        start_key: int,
+        tail: list[dict[str, Any]],
+    ) -> ColumnarEvents:
+        """Create the store of events from this store and tail.
+
+        Events are the events of this store ending after start, in response
+        order, followed by tail. Only the tail is parsed.
+        """
+
+        keep = self.ends > start_key
+
+        # Kept rows are renumbered by their position in events
+        kept = np.zeros(len(self.events), bool)
+        kept[self.rows[keep]] = True
+        positions = np.cumsum(kept) - 1
+
+        store = ColumnarEvents(self.calendar, tail, self.texts)
+        order = np.argsort(
+            np.concatenate((self.starts[keep], store.starts)), kind="stable"
+        )
+        store.events = events
+        store.rows = np.concatenate(
+            (positions[self.rows[keep]], store.rows + int(kept.sum()))
+        )[order]
+        store.starts = np.concatenate((self.starts[keep], store.starts))[order]
+        store.ends = np.concatenate((self.ends[keep], store.ends))[order]
+        store.start_times = np.concatenate((self.start_times[keep], store.start_times))[
+            order
+        ]
+        store.end_times = np.concatenate((self.end_times[keep], store.end_times))[order]
+        store.summaries = np.concatenate((self.summaries[keep], store.summaries))[order]
+        store.descriptions = np.concatenate(
+            (self.descriptions[keep], store.descriptions)
+        )[order]
+
+        return store
+
+    # ------------------------------------------------------
+    def iter_items(
+        self, start_key: int, end_key: int, remove_recurring: bool
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate response items overlapping start to end in start order."""
+
+        # Rows are ordered by start, so rows before stop start before end
+        positions = np.flatnonzero(self.ends[: self.get_stop(end_key)] > start_key)
+
+        if not remove_recurring:
+            for position in positions.tolist():
+                yield self.events[int(self.rows[position])]
+
+            return
+
+        # Series are detected in growing chunks, so a consumer stopping after
+        # a few events does not pay for the whole window.
+        seen: set[tuple] = set()
+        chunk_start: int = 0
+        chunk_size: int = COLUMNAR_CHUNK_SIZE
+
+        while chunk_start < len(positions):
+            chunk = positions[chunk_start : chunk_start + chunk_size]
+
+            for position in self.get_first_of_series(chunk).tolist():
+                recurring_key: tuple = (
+                    int(self.summaries[position]),
+                    int(self.descriptions[position]),
+                    int(self.start_times[position]),
+                    int(self.end_times[position]),
+                )
+
+                if recurring_key in seen:
+                    continue
+
+                seen.add(recurring_key)
+                yield self.events[int(self.rows[position])]
+
+            chunk_start += chunk_size
+            chunk_size *= 4
+
+    # ------------------------------------------------------
+    def get_stop(self, end_key: int) -> int:
+        """Position of the first row starting at or after end."""
+
+        return int(np.searchsorted(self.starts, end_key, side="left"))
+
+    # ------------------------------------------------------
+    def get_first_of_series(self, positions: Any) -> Any:
+        """Keep the first position of each recurring series, in start order."""
+
+        if len(positions) == 0:
+            return positions
+
+        columns: list[Any] = [
+            self.summaries[positions],
+            self.descriptions[positions],
+            self.start_times[positions],
+            self.end_times[positions],
+        ]
+        order = np.lexsort((positions, *reversed(columns)))
+        first = np.zeros(len(positions), bool)
+        first[0] = True
+
+        for column in columns:
+            ordered = column[order]
+            first[1:] |= ordered[1:] != ordered[:-1]
+
+        return np.sort(positions[order[first]])
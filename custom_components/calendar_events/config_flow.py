@@ -30,9 +30,13 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
+    CONF_ADAPTIVE_FETCH,
     CONF_CALENDAR_ENTITY_IDS,
     CONF_DAYS_AHEAD,
+    CONF_FETCH_CACHE_TTL,
+    CONF_FETCH_INTERVAL,
     CONF_FORMAT_LANGUAGE,
+    CONF_INCREMENTAL_FETCH,
     CONF_MAX_EVENTS,
     CONF_MD_HEADER_TEMPLATE,
     CONF_MD_ITEM_TEMPLATE,
@@ -95,6 +99,38 @@ CONFIG_OPTIONS = {
         CONF_REMOVE_RECURRING_EVENTS,
         default=True,
     ): BooleanSelector(),
+    vol.Required(
+        CONF_FETCH_INTERVAL,
+        default=5,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=1,
+            max=1440,
+            step=1,
+            mode=NumberSelectorMode.BOX,
+            unit_of_measurement="min",
+        )
+    ),
+    vol.Required(
+        CONF_FETCH_CACHE_TTL,
+        default=60,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=0,
+            max=3600,
+            step=1,
+            mode=NumberSelectorMode.BOX,
+            unit_of_measurement="s",
+        )
+    ),
+    vol.Required(
+        CONF_ADAPTIVE_FETCH,
+        default=False,
+    ): BooleanSelector(),
+    vol.Required(
+        CONF_INCREMENTAL_FETCH,
+        default=False,
+    ): BooleanSelector(),
 }
 
 CONFIG_OPTIONS_ENTITIES = {
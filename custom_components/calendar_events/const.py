@@ -1,5 +1,6 @@
 """Constants for Calendar events integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 DOMAIN = "calendar_events"
@@ -20,6 +21,10 @@ CONF_SHOW_END_DATE = "show_show_end_date"
 CONF_SHOW_SUMMARY = "show_summary"
 CONF_USE_SUMMARY_AS_ENTITY_NAME = "use_summary_as_entity_name"
 CONF_FORMAT_LANGUAGE = "format_language"
+CONF_FETCH_CACHE_TTL = "fetch_cache_ttl"
+CONF_FETCH_INTERVAL = "fetch_interval"
+CONF_ADAPTIVE_FETCH = "adaptive_fetch"
+CONF_INCREMENTAL_FETCH = "incremental_fetch"
 
 CONF_MD_HEADER_TEMPLATE = "md_header_template"
 CONF_DEFAULT_MD_HEADER_TEMPLATE = "defaults.default_md_header_template"
@@ -28,3 +33,63 @@ CONF_MD_ITEM_TEMPLATE = "md_item_template"
 CONF_DEFAULT_MD_ITEM_TEMPLATE = "defaults.default_md_item_template"
 
 SERVICE_SAVE_SETTINGS = "save_settings"
+
+# Options only changing how the events are shown. Changing them re-renders
+# the events in place.
+PRESENTATION_OPTIONS = frozenset(
+    {
+        CONF_SHOW_EVENT_AS_TIME_TO,
+        CONF_SHOW_END_DATE,
+        CONF_SHOW_SUMMARY,
+        CONF_USE_SUMMARY_AS_ENTITY_NAME,
+        CONF_FORMAT_LANGUAGE,
+        CONF_MD_HEADER_TEMPLATE,
+        CONF_MD_ITEM_TEMPLATE,
+    }
+)
+
+# Options applied in place, any other option change reloads the config entry.
+# Changing max events resizes the pool of event sensors.
+IN_PLACE_OPTIONS = PRESENTATION_OPTIONS | {CONF_MAX_EVENTS}
+
+ATTR_EVENTS = "events"
+ATTR_MARKDOWN_TEXT = "markdown_text"
+
+# Keep the markdown attribute within the state attribute size limit
+MARKDOWN_MAX_SIZE = 16384
+
+DATA_FETCH_CACHE = "fetch_cache"
+DATA_FORMATTERS = "formatters"
+
+REFRESH_SAFETY_NET_INTERVAL = timedelta(minutes=15)
+
+# Min time between refreshes for relative times, shown down to the second
+RELATIVE_TIME_MIN_INTERVAL = timedelta(minutes=1)
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30
+
+# Max time to wait for one source calendar to return its events
+FETCH_TIMEOUT = 30
+
+# Consecutive failures before a source calendar is no longer fetched, and
+# the backoff range before it is probed again
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+CIRCUIT_BREAKER_MIN_BACKOFF = timedelta(minutes=1)
+CIRCUIT_BREAKER_MAX_BACKOFF = timedelta(hours=1)
+
+# First window fetched in adaptive fetch mode, and the factor it is widened
+# by until enough events are found
+ADAPTIVE_FETCH_MIN_WINDOW = timedelta(days=7)
+ADAPTIVE_FETCH_GROWTH = 4
+
+# Max time between full fetches in incremental fetch mode. Changes to events
+# not shown in a calendar entity state are picked up within this interval.
+INCREMENTAL_FETCH_RESYNC_INTERVAL = timedelta(hours=1)
+
+# Number of raw events of all calendar responses together from which the
+# columnar store is used
+COLUMNAR_MIN_EVENTS = 5000
+
+# Max number of events kept by the range cache of the merged calendar
+RANGE_CACHE_MAX_EVENTS = 10000
@@ -0,0 +1,77 @@
+"""Datetime formatter for Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from functools import cached_property
+
+from arrow.locales import get_locale
+from babel import Locale
+from babel.dates import format_date, format_time, get_datetime_format
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_FORMATTERS, DOMAIN
+from .relative_time import RelativeTimeFormatter, get_seconds
+
+DATE_FORMAT = "medium"
+TIME_FORMAT = "short"
+DATETIME_FORMAT = "medium"
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class DateTimeFormatter:
+    """Datetime formatter for one language."""
+
+    def __init__(self, language: str) -> None:
+        """Init."""
+
+        self.language: str = language
+        self.locale: Locale = Locale.parse(language)
+        # Reading a pattern loads all locale data of the language
+        self.datetime_format: str = get_datetime_format(DATETIME_FORMAT, self.locale)
+        self.relative_time: RelativeTimeFormatter = RelativeTimeFormatter(self.locale)
+
+    # ------------------------------------------------------
+    @cached_property
+    def now(self) -> str:
+        """Now as text."""
+
+        return get_locale(self.language).timeframes.get("now", "now").capitalize()
+
+    # ------------------------------------------------------
+    def format_date(self, date_time: datetime) -> str:
+        """Format date."""
+
+        return format_date(date_time, DATE_FORMAT, self.locale)
+
+    # ------------------------------------------------------
+    def format_datetime(self, date_time: datetime) -> str:
+        """Format date and time."""
+
+        return self.datetime_format.format(
+            format_time(date_time, TIME_FORMAT, locale=self.locale),
+            format_date(date_time, DATE_FORMAT, self.locale),
+        )
+
+    # ------------------------------------------------------
+    def format_timedelta(self, delta: timedelta) -> str:
+        """Format timedelta relative to now."""
+
+        return self.relative_time.format(get_seconds(delta))
+
+
+# ------------------------------------------------------
+async def async_get_formatter(hass: HomeAssistant, language: str) -> DateTimeFormatter:
+    """Get the formatter for a language, shared by all config entries."""
+
+    formatters: dict[str, DateTimeFormatter] = hass.data[DOMAIN].setdefault(
+        DATA_FORMATTERS, {}
+    )
+
+    if (formatter := formatters.get(language)) is None:
+        formatter = await hass.async_add_executor_job(DateTimeFormatter, language)
+        formatters[language] = formatter
+
+    return formatter
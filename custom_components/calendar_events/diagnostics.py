@@ -0,0 +1,36 @@
+"""Diagnostics support for Calendar events helper."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .calendar_handler import CalendarHandler
+from .const import DOMAIN
+from .range_cache import CalendarRangeCache
+from .refresh_gate import RefreshGate
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    calendar_handler: CalendarHandler = hass.data[DOMAIN][entry.entry_id][
+        "calendar_handler"
+    ]
+    range_cache: CalendarRangeCache = hass.data[DOMAIN][entry.entry_id]["range_cache"]
+    refresh_gate: RefreshGate = hass.data[DOMAIN][entry.entry_id]["refresh_gate"]
+
+    return {
+        "options": dict(entry.options),
+        "calendar_handler": calendar_handler.get_diagnostics(),
+        "fetch_cache": calendar_handler.fetch_cache.get_diagnostics(
+            calendar_handler.calendar_entities
+        ),
+        "range_cache": range_cache.get_diagnostics(),
+        "refresh_gate": refresh_gate.get_diagnostics(),
+    }
@@ -0,0 +1,124 @@
+"""Interval index for Calendar events helper."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components import calendar
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .calendar_handler import CalendarEvent
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND = timedelta(microseconds=1)
+
+
+# ------------------------------------------------------
+def get_epoch_key(value: datetime) -> int:
+    """Microseconds since the epoch of an aware datetime.
+
+    Keys compare like the instants they represent, whatever the offsets.
+    """
+
+    return (value - EPOCH) // MICROSECOND
+
+
+# ------------------------------------------------------
+def parse_event_datetime(value: str) -> datetime:
+    """Parse a start or end value from a calendar service response.
+
+    All day events are anchored at midnight in the local time zone, so every
+    parsed value is timezone aware.
+    """
+
+    if len(value) == 10:
+        return dt_util.start_of_local_day(date.fromisoformat(value))
+
+    parsed: datetime = datetime.fromisoformat(value)
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+    return parsed
+
+
+# ------------------------------------------------------
+def create_calendar_event(event: CalendarEvent) -> calendar.CalendarEvent:
+    """Create calendar entity event from event."""
+
+    if event.all_day:
+        return calendar.CalendarEvent(
+            summary=event.summary,
+            description=event.description,
+            location=event.location,
+            start=event.start.date(),
+            end=event.end.date(),
+        )
+
+    return calendar.CalendarEvent(
+        summary=event.summary,
+        description=event.description,
+        location=event.location,
+        start=event.start,
+        end=event.end,
+    )
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class EventIntervalIndex:
+    """Interval index over events."""
+
+    def __init__(self, events: list[CalendarEvent]) -> None:
+        """Init."""
+
+        self.events: list[CalendarEvent] = sorted(events, key=lambda x: x.start_key)
+        self.starts: list[int] = [event.start_key for event in self.events]
+        self.max_ends: list[int] = []
+        self.calendar_events: dict[tuple, calendar.CalendarEvent] = {}
+
+        for event in self.events:
+            if self.max_ends and self.max_ends[-1] > event.end_key:
+                self.max_ends.append(self.max_ends[-1])
+            else:
+                self.max_ends.append(event.end_key)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        """Number of events."""
+
+        return len(self.events)
+
+    # ------------------------------------------------------
+    def get(self, index: int) -> calendar.CalendarEvent:
+        """Get calendar entity event by position."""
+
+        event: CalendarEvent = self.events[index]
+        key: tuple = event.identity_key
+
+        if (calendar_event := self.calendar_events.get(key)) is None:
+            calendar_event = create_calendar_event(event)
+            self.calendar_events[key] = calendar_event
+
+        return calendar_event
+
+    # ------------------------------------------------------
+    def query_events(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[CalendarEvent, calendar.CalendarEvent]]:
+        """Iterate events and calendar entity events overlapping start to end."""
+
+        start_key: int = get_epoch_key(start)
+
+        # Events starting before end, of which only those from the first
+        # index with a max end after start can overlap.
+        stop: int = bisect_left(self.starts, get_epoch_key(end))
+        first: int = bisect_right(self.max_ends, start_key, 0, stop)
+
+        for index in range(first, stop):
+            if self.events[index].end_key > start_key:
+                yield self.events[index], self.get(index)
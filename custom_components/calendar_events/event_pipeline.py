@@ -0,0 +1,76 @@
+"""Event pipeline for Calendar events helper."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+import heapq
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .calendar_handler import CalendarEvent
+
+EventStage = Callable[[Iterator["CalendarEvent"]], Iterator["CalendarEvent"]]
+
+
+# ------------------------------------------------------
+def filter_window(
+    events: Iterator[CalendarEvent], start_key: int, end_key: int
+) -> Iterator[CalendarEvent]:
+    """Keep events overlapping start to end, from events ordered by start."""
+
+    for event in events:
+        if event.end_key <= start_key:
+            continue
+
+        if event.start_key >= end_key:
+            return
+
+        yield event
+
+
+# ------------------------------------------------------
+def merge_by_start(
+    streams: Iterable[Iterator[CalendarEvent]],
+) -> Iterator[CalendarEvent]:
+    """Merge streams ordered by start into one stream ordered by start."""
+
+    return heapq.merge(*streams, key=lambda x: x.start_key)
+
+
+# ------------------------------------------------------
+def remove_recurring_events(events: Iterator[CalendarEvent]) -> Iterator[CalendarEvent]:
+    """Keep the first event of each recurring series."""
+
+    seen: set[tuple] = set()
+
+    for event in events:
+        recurring_key: tuple = event.recurring_key
+
+        if recurring_key in seen:
+            continue
+
+        seen.add(recurring_key)
+        yield event
+
+
+# ------------------------------------------------------
+def limit(max_events: int) -> EventStage:
+    """Create a stage keeping the first max events."""
+
+    def limit_stage(events: Iterator[CalendarEvent]) -> Iterator[CalendarEvent]:
+        return islice(events, max_events)
+
+    return limit_stage
+
+
+# ------------------------------------------------------
+def run_stages(
+    events: Iterator[CalendarEvent], stages: list[EventStage]
+) -> Iterator[CalendarEvent]:
+    """Chain stages onto events."""
+
+    for stage in stages:
+        events = stage(events)
+
+    return events
@@ -0,0 +1,446 @@
+"""Shared fetch cache for Calendar events helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .circuit_breaker import BreakerState, CircuitBreaker
+from .const import FETCH_TIMEOUT, LOGGER
+from .event_index import get_epoch_key, parse_event_datetime
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class FetchCacheEntry:
+    """Events fetched for one calendar entity."""
+
+    start: datetime
+    end: datetime
+    fetched: datetime
+    events: list[dict[str, Any]]
+    expired: bool = False
+    extended: datetime | None = None
+    end_keys: list[int] | None = None
+    extension: FetchExtension | None = None
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class FetchExtension:
+    """Events of an entry extended from the events of the entry before.
+
+    The events are the base events ending after start, followed by tail.
+    """
+
+    base: list[dict[str, Any]]
+    start_key: int
+    tail: list[dict[str, Any]]
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class FetchInFlight:
+    """Fetch in progress for one calendar entity."""
+
+    start: datetime
+    end: datetime
+    task: asyncio.Task[list[dict[str, Any]]]
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class FetchStatistics:
+    """Fetch statistics for one calendar entity."""
+
+    fetch_count: int = 0
+    failure_count: int = 0
+    timeout_count: int = 0
+    last_latency: float | None = None
+    total_latency: float = 0
+    last_error: str | None = None
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        """Statistics as dict."""
+
+        return {
+            "fetch_count": self.fetch_count,
+            "failure_count": self.failure_count,
+            "timeout_count": self.timeout_count,
+            "last_latency": self.last_latency,
+            "average_latency": (
+                self.total_latency / self.fetch_count if self.fetch_count else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CalendarFetchCache:
+    """Calendar fetch cache shared by all config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.entries: dict[str, FetchCacheEntry] = {}
+        self.in_flight: dict[str, FetchInFlight] = {}
+        self.statistics: dict[str, FetchStatistics] = {}
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    # ------------------------------------------------------
+    async def async_get_events(
+        self,
+        calendar_entities: list[str],
+        start: datetime,
+        end: datetime,
+        max_age: timedelta,
+        resync_interval: timedelta | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get raw events for calendar entities covering start to end.
+
+        The returned lists may hold events outside the window, callers slice
+        their own view from them.
+        """
+
+        now: datetime = dt_util.utcnow()
+        events: dict[str, list[dict[str, Any]]] = {}
+        pending: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+        for calendar_entity in calendar_entities:
+            entry: FetchCacheEntry | None = self.entries.get(calendar_entity)
+            extendable: bool = (
+                entry is not None
+                and not entry.expired
+                and entry.start <= start
+                and resync_interval is not None
+                and now - entry.fetched <= resync_interval
+            )
+
+            if (
+                entry is not None
+                and not entry.expired
+                and entry.start <= start
+                and entry.end >= end
+                and (extendable or now - entry.fetched <= max_age)
+            ):
+                events[calendar_entity] = entry.events
+                continue
+
+            in_flight: FetchInFlight | None = self.in_flight.get(calendar_entity)
+
+            if in_flight is None or in_flight.start > start or in_flight.end < end:
+                if not self.allow_request(calendar_entity, now):
+                    events[calendar_entity] = entry.events if entry is not None else []
+                    continue
+
+                # Fetch a little past the window, so callers asking for the
+                # same window within max age are still covered.
+                if extendable:
+                    in_flight = FetchInFlight(
+                        start,
+                        end + max_age,
+                        self.hass.async_create_task(
+                            self.async_extend(
+                                calendar_entity, entry, start, end + max_age
+                            )
+                        ),
+                    )
+                else:
+                    in_flight = FetchInFlight(
+                        start,
+                        end + max_age,
+                        self.hass.async_create_task(
+                            self.async_fetch(calendar_entity, start, end + max_age)
+                        ),
+                    )
+                self.in_flight[calendar_entity] = in_flight
+
+            if (
+                entry is not None
+                and self.breakers[calendar_entity].state == BreakerState.HALF_OPEN
+            ):
+                # Serve stale, the probe result is used by the next request
+                events[calendar_entity] = entry.events
+                continue
+
+            pending[calendar_entity] = in_flight.task
+
+        if pending:
+            # Cancelling a caller must not cancel the fetch shared with others
+            for calendar_entity, calendar_events in zip(
+                pending,
+                await asyncio.gather(*map(asyncio.shield, pending.values())),
+                strict=True,
+            ):
+                events[calendar_entity] = calendar_events
+
+        return {
+            calendar_entity: events[calendar_entity]
+            for calendar_entity in calendar_entities
+        }
+
+    # ------------------------------------------------------
+    @callback
+    def async_invalidate(self, calendar_entity: str) -> None:
+        """Expire cached events for a calendar entity.
+
+        The events are kept as last known events.
+        """
+
+        if (entry := self.entries.get(calendar_entity)) is not None:
+            entry.expired = True
+
+    # ------------------------------------------------------
+    def allow_request(self, calendar_entity: str, now: datetime) -> bool:
+        """Check the circuit breaker of a calendar entity."""
+
+        return self.breakers.setdefault(
+            calendar_entity, CircuitBreaker()
+        ).allow_request(now)
+
+    # ------------------------------------------------------
+    def is_available(self, calendar_entity: str) -> bool:
+        """Check if the last fetch from a calendar entity succeeded."""
+
+        breaker: CircuitBreaker | None = self.breakers.get(calendar_entity)
+
+        return breaker is None or (
+            breaker.state == BreakerState.CLOSED and breaker.failure_count == 0
+        )
+
+    # ------------------------------------------------------
+    async def async_fetch(
+        self,
+        calendar_entity: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Fetch events from a calendar entity and cache them.
+
+        Falls back to the last known events when the fetch fails.
+        """
+
+        fetch_start: datetime = dt_util.utcnow()
+
+        try:
+            events: list[dict[str, Any]] = await self.async_call_get_events(
+                calendar_entity, start, end
+            )
+        except Exception as err:  # noqa: BLE001
+            LOGGER.error(err)
+            entry: FetchCacheEntry | None = self.entries.get(calendar_entity)
+            return entry.events if entry is not None else []
+        finally:
+            in_flight: FetchInFlight | None = self.in_flight.get(calendar_entity)
+
+            if in_flight is not None and in_flight.task is asyncio.current_task():
+                del self.in_flight[calendar_entity]
+
+        entry = self.entries.get(calendar_entity)
+
+        # Keep an entry covering the window stored while fetching
+        if (
+            entry is not None
+            and not entry.expired
+            and entry.fetched >= fetch_start
+            and entry.start <= start
+            and entry.end >= end
+        ):
+            return entry.events
+
+        self.entries[calendar_entity] = FetchCacheEntry(
+            start, end, dt_util.utcnow(), events
+        )
+        return events
+
+    # ------------------------------------------------------
+    async def async_extend(
+        self,
+        calendar_entity: str,
+        entry: FetchCacheEntry,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Extend cached events of a calendar entity to start to end."""
+
+        try:
+            tail: list[dict[str, Any]] = await self.async_call_get_events(
+                calendar_entity, entry.end, end
+            )
+        except Exception as err:  # noqa: BLE001
+            LOGGER.error(err)
+            return entry.events
+        finally:
+            in_flight: FetchInFlight | None = self.in_flight.get(calendar_entity)
+
+            if in_flight is not None and in_flight.task is asyncio.current_task():
+                del self.in_flight[calendar_entity]
+
+        start_key: int = get_epoch_key(start)
+        cached_end_key: int = get_epoch_key(entry.end)
+        end_keys: list[int] = (
+            entry.end_keys
+            if entry.end_keys is not None
+            else [
+                get_epoch_key(parse_event_datetime(item["end"]))
+                for item in entry.events
+            ]
+        )
+        kept: list[int] = [
+            index for index, end_key in enumerate(end_keys) if end_key > start_key
+        ]
+
+        # Events starting before the cached end are cached already
+        tail = [
+            item
+            for item in tail
+            if get_epoch_key(parse_event_datetime(item["start"])) >= cached_end_key
+        ]
+        events: list[dict[str, Any]] = entry.events
+        extension: FetchExtension | None = entry.extension
+
+        # Unchanged events are kept as the same list, so callers can reuse
+        # what they created from it
+        if tail or len(kept) < len(entry.events):
+            events = [entry.events[index] for index in kept] + tail
+            end_keys = [end_keys[index] for index in kept] + [
+                get_epoch_key(parse_event_datetime(item["end"])) for item in tail
+            ]
+            extension = FetchExtension(entry.events, start_key, tail)
+
+        # Keep an entry replaced or expired while fetching
+        if self.entries.get(calendar_entity) is entry and not entry.expired:
+            self.entries[calendar_entity] = FetchCacheEntry(
+                start,
+                end,
+                entry.fetched,
+                events,
+                extended=dt_util.utcnow(),
+                end_keys=end_keys,
+                extension=extension,
+            )
+
+        return events
+
+    # ------------------------------------------------------
+    def get_extension(
+        self, calendar_entity: str, events: list[dict[str, Any]]
+    ) -> FetchExtension | None:
+        """Get how cached events were extended, None if fetched in full."""
+
+        entry: FetchCacheEntry | None = self.entries.get(calendar_entity)
+
+        if entry is None or entry.events is not events:
+            return None
+
+        return entry.extension
+
+    # ------------------------------------------------------
+    async def async_call_get_events(
+        self,
+        calendar_entity: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Call calendar.get_events for a calendar entity without caching."""
+
+        statistics: FetchStatistics = self.statistics.setdefault(
+            calendar_entity, FetchStatistics()
+        )
+        statistics.fetch_count += 1
+        fetch_start: float = monotonic()
+
+        try:
+            async with asyncio.timeout(FETCH_TIMEOUT):
+                response: dict = await self.hass.services.async_call(
+                    "calendar",
+                    "get_events",
+                    service_data={
+                        ATTR_ENTITY_ID: calendar_entity,
+                        "end_date_time": end.isoformat(),
+                        "start_date_time": start.isoformat(),
+                    },
+                    blocking=True,
+                    return_response=True,
+                )
+        except TimeoutError as err:
+            statistics.timeout_count += 1
+            self.record_failure(
+                calendar_entity, f"Timeout after {FETCH_TIMEOUT} seconds"
+            )
+            raise TimeoutError(
+                f"Timeout fetching events from {calendar_entity}"
+            ) from err
+        except Exception as err:
+            self.record_failure(calendar_entity, str(err))
+            raise
+        finally:
+            statistics.last_latency = monotonic() - fetch_start
+            statistics.total_latency += statistics.last_latency
+
+        self.breakers.setdefault(calendar_entity, CircuitBreaker()).record_success()
+        return response.get(calendar_entity, {}).get("events", [])
+
+    # ------------------------------------------------------
+    def record_failure(self, calendar_entity: str, error: str) -> None:
+        """Record a failed fetch from a calendar entity."""
+
+        statistics: FetchStatistics = self.statistics[calendar_entity]
+        statistics.failure_count += 1
+        statistics.last_error = error
+        breaker: CircuitBreaker = self.breakers.setdefault(
+            calendar_entity, CircuitBreaker()
+        )
+
+        if breaker.record_failure(dt_util.utcnow()):
+            LOGGER.warning(
+                "Fetching events from %s keeps failing, next attempt at %s",
+                calendar_entity,
+                breaker.retry_at,
+            )
+
+    # ------------------------------------------------------
+    def get_diagnostics(self, calendar_entities: list[str]) -> dict[str, Any]:
+        """Get diagnostics for calendar entities."""
+
+        return {
+            calendar_entity: {
+                "cached_window": (
+                    {
+                        "start": entry.start,
+                        "end": entry.end,
+                        "fetched": entry.fetched,
+                        "extended": entry.extended,
+                        "events": len(entry.events),
+                        "expired": entry.expired,
+                    }
+                    if (entry := self.entries.get(calendar_entity)) is not None
+                    else None
+                ),
+                "statistics": (
+                    statistics.as_dict()
+                    if (statistics := self.statistics.get(calendar_entity)) is not None
+                    else None
+                ),
+                "circuit_breaker": (
+                    breaker.as_dict()
+                    if (breaker := self.breakers.get(calendar_entity)) is not None
+                    else None
+                ),
+            }
+            for calendar_entity in calendar_entities
+        }
@@ -0,0 +1,368 @@
+"""Range cache for Calendar events helper."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+from time import monotonic
+from typing import Any
+
+from homeassistant.components import calendar
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .calendar_handler import CalendarEvent, CalendarHandler, get_calendar_name
+from .const import (
+    CONF_FETCH_INTERVAL,
+    CONF_REMOVE_RECURRING_EVENTS,
+    LOGGER,
+    RANGE_CACHE_MAX_EVENTS,
+)
+from .event_index import EventIntervalIndex, get_epoch_key
+from .fetch_cache import CalendarFetchCache, FetchCacheEntry
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class RangeSegment:
+    """Fetched range of one calendar entity."""
+
+    start: datetime
+    end: datetime
+    fetched: datetime
+    index: EventIntervalIndex
+    last_used: float
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(slots=True)
+class RangeFetch:
+    """Gap fetch in progress for one calendar entity."""
+
+    start: datetime
+    end: datetime
+    task: asyncio.Task[None]
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class CalendarRangeCache:
+    """Range cache for the merged calendar."""
+
+    def __init__(
+        self, calendar_handler: CalendarHandler, calendar_entities: list[str]
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = calendar_handler.hass
+        self.calendar_handler: CalendarHandler = calendar_handler
+        self.calendar_entities: list[str] = calendar_entities
+        self.fetch_cache: CalendarFetchCache = calendar_handler.fetch_cache
+        self.segments: dict[str, list[RangeSegment]] = {}
+        self.in_flight: dict[str, list[RangeFetch]] = {}
+
+    # ------------------------------------------------------
+    async def async_get_events(
+        self, start: datetime, end: datetime
+    ) -> list[calendar.CalendarEvent]:
+        """Get calendar entity events overlapping start to end."""
+
+        calendar_entities: list[str] = self.calendar_entities
+        now: datetime = dt_util.utcnow()
+        max_age: timedelta = timedelta(
+            minutes=self.calendar_handler.entry_options.get(CONF_FETCH_INTERVAL, 5)
+        )
+        tasks: list[asyncio.Task[None]] = []
+
+        for calendar_entity in calendar_entities:
+            self.segments[calendar_entity] = [
+                segment
+                for segment in self.segments.get(calendar_entity, [])
+                if now - segment.fetched <= max_age
+            ]
+            self.add_cached_segment(calendar_entity, start, end, now, max_age)
+
+            # Gaps being fetched by another query are awaited, not fetched
+            in_flight: list[RangeFetch] = self.in_flight.setdefault(calendar_entity, [])
+            tasks.extend(
+                fetch.task
+                for fetch in in_flight
+                if fetch.start < end and fetch.end > start
+            )
+
+            for gap_start, gap_end in self.get_gaps(calendar_entity, start, end):
+                fetch: RangeFetch = RangeFetch(
+                    gap_start,
+                    gap_end,
+                    self.hass.async_create_task(
+                        self.async_fetch_gap(calendar_entity, gap_start, gap_end)
+                    ),
+                )
+                in_flight.append(fetch)
+                tasks.append(fetch.task)
+
+        if tasks:
+            # Cancelling a query must not cancel fetches shared with others
+            await asyncio.gather(*map(asyncio.shield, tasks))
+
+        used: float = monotonic()
+        indexes: list[EventIntervalIndex] = []
+
+        for calendar_entity in calendar_entities:
+            for segment in self.segments.get(calendar_entity, []):
+                if segment.start < end and segment.end > start:
+                    segment.last_used = used
+                    indexes.append(segment.index)
+
+        self.evict()
+
+        return self.merge_results(indexes, start, end)
+
+    # ------------------------------------------------------
+    def get_gaps(
+        self, calendar_entity: str, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Get the parts of start to end not covered for a calendar entity.
+
+        Ranges being fetched count as covered.
+        """
+
+        gaps: list[tuple[datetime, datetime]] = []
+        cursor: datetime = start
+        covered: list[tuple[datetime, datetime]] = sorted(
+            [
+                (segment.start, segment.end)
+                for segment in self.segments.get(calendar_entity, [])
+            ]
+            + [
+                (fetch.start, fetch.end)
+                for fetch in self.in_flight.get(calendar_entity, [])
+            ]
+        )
+
+        for covered_start, covered_end in covered:
+            if covered_end <= cursor:
+                continue
+
+            if covered_start >= end:
+                break
+
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+
+            cursor = covered_end
+
+        if cursor < end:
+            gaps.append((cursor, end))
+
+        return gaps
+
+    # ------------------------------------------------------
+    async def async_fetch_gap(
+        self, calendar_entity: str, start: datetime, end: datetime
+    ) -> None:
+        """Fetch a gap for a calendar entity and merge it into the segments."""
+
+        try:
+            if not self.fetch_cache.allow_request(calendar_entity, dt_util.utcnow()):
+                return
+
+            fetched: datetime = dt_util.utcnow()
+            response: list = await self.fetch_cache.async_call_get_events(
+                calendar_entity, start, end
+            )
+        except Exception as err:  # noqa: BLE001
+            LOGGER.error(err)
+            return
+        finally:
+            in_flight: list[RangeFetch] = self.in_flight.get(calendar_entity, [])
+            fetch: RangeFetch | None = next(
+                (fetch for fetch in in_flight if fetch.task is asyncio.current_task()),
+                None,
+            )
+
+            if fetch is not None:
+                in_flight.remove(fetch)
+
+        # Dropped by an invalidation while fetching
+        if fetch is None:
+            return
+
+        calendar_name: str = get_calendar_name(calendar_entity)
+        self.add_segment(
+            calendar_entity,
+            start,
+            end,
+            [CalendarEvent.from_response(calendar_name, item) for item in response],
+            fetched,
+        )
+
+    # ------------------------------------------------------
+    def add_cached_segment(
+        self,
+        calendar_entity: str,
+        start: datetime,
+        end: datetime,
+        now: datetime,
+        max_age: timedelta,
+    ) -> None:
+        """Add the part of start to end held by the fetch cache as a segment."""
+
+        entry: FetchCacheEntry | None = self.fetch_cache.entries.get(calendar_entity)
+
+        if entry is None or entry.expired or now - entry.fetched > max_age:
+            return
+
+        start = max(start, entry.start)
+        end = min(end, entry.end)
+
+        if start >= end or not self.get_gaps(calendar_entity, start, end):
+            return
+
+        calendar_name: str = get_calendar_name(calendar_entity)
+        start_key: int = get_epoch_key(start)
+        end_key: int = get_epoch_key(end)
+        self.add_segment(
+            calendar_entity,
+            start,
+            end,
+            [
+                event
+                for event in (
+                    CalendarEvent.from_response(calendar_name, item)
+                    for item in entry.events
+                )
+                if event.end_key > start_key and event.start_key < end_key
+            ],
+            entry.fetched,
+        )
+
+    # ------------------------------------------------------
+    def add_segment(
+        self,
+        calendar_entity: str,
+        start: datetime,
+        end: datetime,
+        events: list[CalendarEvent],
+        fetched: datetime,
+    ) -> None:
+        """Add a fetched range, merging it with touching segments."""
+
+        merged: dict[tuple, CalendarEvent] = {}
+        segments: list[RangeSegment] = []
+
+        for segment in self.segments.get(calendar_entity, []):
+            if segment.end < start or segment.start > end:
+                segments.append(segment)
+                continue
+
+            start = min(start, segment.start)
+            end = max(end, segment.end)
+            fetched = min(fetched, segment.fetched)
+
+            for event in segment.index.events:
+                merged[event.identity_key] = event
+
+        for event in events:
+            merged[event.identity_key] = event
+
+        segments.append(
+            RangeSegment(
+                start,
+                end,
+                fetched,
+                EventIntervalIndex(list(merged.values())),
+                monotonic(),
+            )
+        )
+        segments.sort(key=lambda x: x.start)
+        self.segments[calendar_entity] = segments
+
+    # ------------------------------------------------------
+    def merge_results(
+        self,
+        indexes: list[EventIntervalIndex],
+        start: datetime,
+        end: datetime,
+    ) -> list[calendar.CalendarEvent]:
+        """Merge the events overlapping start to end from the indexes."""
+
+        remove_recurring: bool = self.calendar_handler.entry_options.get(
+            CONF_REMOVE_RECURRING_EVENTS, True
+        )
+        seen: set[tuple] = set()
+        calendar_events: list[calendar.CalendarEvent] = []
+
+        for event, calendar_event in heapq.merge(
+            *(index.query_events(start, end) for index in indexes),
+            key=lambda x: x[0].start_key,
+        ):
+            if remove_recurring:
+                recurring_key: tuple = event.recurring_key
+
+                if recurring_key in seen:
+                    continue
+
+                seen.add(recurring_key)
+
+            calendar_events.append(calendar_event)
+
+        return calendar_events
+
+    # ------------------------------------------------------
+    def evict(self) -> None:
+        """Evict least recently used segments above the memory budget."""
+
+        segments: list[tuple[str, RangeSegment]] = [
+            (calendar_entity, segment)
+            for calendar_entity, calendar_segments in self.segments.items()
+            for segment in calendar_segments
+        ]
+        size: int = sum(len(segment.index) for _, segment in segments)
+
+        if size <= RANGE_CACHE_MAX_EVENTS:
+            return
+
+        segments.sort(key=lambda x: x[1].last_used)
+
+        # Never evict the segments used by the last query
+        last_used: float = segments[-1][1].last_used
+
+        for calendar_entity, segment in segments:
+            if size <= RANGE_CACHE_MAX_EVENTS or segment.last_used == last_used:
+                break
+
+            self.segments[calendar_entity].remove(segment)
+            size -= len(segment.index)
+
+    # ------------------------------------------------------
+    @callback
+    def async_invalidate(self, calendar_entity: str) -> None:
+        """Drop cached ranges for a calendar entity.
+
+        Gap fetches in progress are still awaited, but not merged.
+        """
+
+        self.segments.pop(calendar_entity, None)
+        self.in_flight.pop(calendar_entity, None)
+
+    # ------------------------------------------------------
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostics."""
+
+        return {
+            calendar_entity: [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "fetched": segment.fetched,
+                    "events": len(segment.index),
+                }
+                for segment in segments
+            ]
+            for calendar_entity, segments in self.segments.items()
+        }
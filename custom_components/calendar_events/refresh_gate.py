@@ -0,0 +1,82 @@
+"""Refresh gate for Calendar events helper."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .calendar_handler import CalendarHandler
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class RefreshGate:
+    """Single flight refresh gate."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        calendar_handler: CalendarHandler,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.coordinator: DataUpdateCoordinator = coordinator
+        self.calendar_handler: CalendarHandler = calendar_handler
+
+        self.task: asyncio.Task[None] | None = None
+        self.follow_up: bool = False
+        self.fetch: bool = False
+        self.refresh_count: int = 0
+        self.coalesced_count: int = 0
+
+    # ------------------------------------------------------
+    async def async_refresh(self, fetch: bool = False) -> None:
+        """Refresh, fetching from the source calendars when fetch is set.
+
+        Returns when a refresh started after the call has completed.
+        """
+
+        self.fetch = self.fetch or fetch
+
+        if self.task is None:
+            self.task = self.hass.async_create_task(self.async_run())
+        else:
+            self.follow_up = True
+            self.coalesced_count += 1
+
+        # Cancelling a caller must not cancel the refresh of the others
+        await asyncio.shield(self.task)
+
+    # ------------------------------------------------------
+    async def async_run(self) -> None:
+        """Run refresh cycles until no follow-up is requested."""
+
+        try:
+            while True:
+                self.follow_up = False
+
+                if self.fetch:
+                    self.fetch = False
+                    self.calendar_handler.async_invalidate()
+
+                self.refresh_count += 1
+                await self.coordinator.async_refresh()
+
+                if not self.follow_up:
+                    return
+        finally:
+            self.task = None
+
+    # ------------------------------------------------------
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Get diagnostics."""
+
+        return {
+            "refresh_count": self.refresh_count,
+            "coalesced_count": self.coalesced_count,
+        }
@@ -0,0 +1,150 @@
+"""Refresh scheduler for Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .calendar_handler import CalendarHandler
+from .const import REFRESH_SAFETY_NET_INTERVAL
+from .fetch_cache import CalendarFetchCache
+from .range_cache import CalendarRangeCache
+from .refresh_gate import RefreshGate
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class RefreshScheduler:
+    """Refresh scheduler."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        refresh_gate: RefreshGate,
+        calendar_handler: CalendarHandler,
+        range_cache: CalendarRangeCache,
+        calendar_entities: list[str],
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.coordinator: DataUpdateCoordinator = coordinator
+        self.refresh_gate: RefreshGate = refresh_gate
+        self.calendar_handler: CalendarHandler = calendar_handler
+        self.range_cache: CalendarRangeCache = range_cache
+        self.calendar_entities: list[str] = calendar_entities
+        self.fetch_cache: CalendarFetchCache = calendar_handler.fetch_cache
+
+        self.next_refresh: datetime | None = None
+        self.template_entities: set[str] = set()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._unsub_template: CALLBACK_TYPE | None = None
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+
+    # ------------------------------------------------------
+    @callback
+    def async_start(self) -> None:
+        """Start scheduling refreshes."""
+
+        self._unsub_listeners = [
+            async_track_state_change_event(
+                self.hass, self.calendar_entities, self.async_calendar_changed
+            ),
+            self.coordinator.async_add_listener(self.async_schedule),
+        ]
+        self.async_schedule()
+
+    # ------------------------------------------------------
+    @callback
+    def async_stop(self) -> None:
+        """Stop scheduling refreshes."""
+
+        for unsub in self._unsub_listeners:
+            unsub()
+
+        self._unsub_listeners = []
+        self.async_cancel_timer()
+        self.async_track_template_entities(set())
+
+    # ------------------------------------------------------
+    @callback
+    def async_cancel_timer(self) -> None:
+        """Cancel the scheduled refresh."""
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    # ------------------------------------------------------
+    @callback
+    def async_schedule(self) -> None:
+        """Schedule the next refresh.
+
+        Called after every coordinator refresh, whatever triggered it.
+        """
+
+        self.async_cancel_timer()
+        self.async_track_template_entities(self.calendar_handler.md_entities)
+
+        now: datetime = dt_util.utcnow()
+        self.next_refresh = now + REFRESH_SAFETY_NET_INTERVAL
+        next_change: datetime | None = self.calendar_handler.get_next_change(now)
+
+        if next_change is not None and next_change < self.next_refresh:
+            self.next_refresh = next_change
+
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self.async_refresh, self.next_refresh
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def async_track_template_entities(self, entities: set[str]) -> None:
+        """Track state changes of the entities used by markdown templates."""
+
+        if entities == self.template_entities:
+            return
+
+        if self._unsub_template is not None:
+            self._unsub_template()
+            self._unsub_template = None
+
+        self.template_entities = set(entities)
+
+        if entities:
+            self._unsub_template = async_track_state_change_event(
+                self.hass, list(entities), self.async_template_entity_changed
+            )
+
+    # ------------------------------------------------------
+    async def async_refresh(self, _now: datetime) -> None:
+        """Refresh at the scheduled time."""
+
+        self._unsub_timer = None
+        await self.refresh_gate.async_refresh()
+
+        # Listeners are not called after repeated failures, keep scheduling
+        if self._unsub_timer is None:
+            self.async_schedule()
+
+    # ------------------------------------------------------
+    async def async_calendar_changed(self, event: Event) -> None:
+        """Refresh when a source calendar changes state."""
+
+        self.fetch_cache.async_invalidate(event.data["entity_id"])
+        self.range_cache.async_invalidate(event.data["entity_id"])
+        await self.refresh_gate.async_refresh(fetch=True)
+
+    # ------------------------------------------------------
+    async def async_template_entity_changed(self, _event: Event) -> None:
+        """Refresh when an entity used by a markdown template changes state."""
+
+        await self.refresh_gate.async_refresh()
@@ -0,0 +1,114 @@
+"""Relative time for Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from babel import Locale
+from babel.dates import TIMEDELTA_UNITS
+
+# Same as the babel format_timedelta defaults
+THRESHOLD = 0.85
+GRANULARITY = "second"
+FORMAT = "long"
+
+
+# ------------------------------------------------------
+def get_seconds(delta: timedelta) -> int:
+    """Whole seconds of a timedelta, rounded down as babel does."""
+
+    return delta.days * 86400 + delta.seconds
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class RelativeTimeFormatter:
+    """Relative time formatter for one locale."""
+
+    def __init__(self, locale: Locale) -> None:
+        """Init."""
+
+        self.locale: Locale = locale
+        self.patterns: dict[tuple[bool, str], list[dict[str, str]]] = {}
+        self.resolved: dict[tuple[bool, str, str], str] = {}
+        self.plural_forms: dict[int, str] = {}
+
+        date_fields = locale._data["date_fields"]
+        unit_patterns = locale._data["unit_patterns"]
+
+        for unit, _ in TIMEDELTA_UNITS:
+            rel_patterns = date_fields.get(f"{unit}-{FORMAT}") or date_fields[unit]
+            duration_patterns = unit_patterns.get(f"duration-{unit}", {})
+
+            for future in (True, False):
+                self.patterns[future, unit] = [
+                    dict(patterns)
+                    for patterns in (
+                        rel_patterns["future" if future else "past"],
+                        duration_patterns.get(FORMAT),
+                        duration_patterns.get("short"),
+                    )
+                    if patterns is not None
+                ]
+
+    # ------------------------------------------------------
+    def get_unit_value(self, seconds: int) -> tuple[bool, str, int]:
+        """Direction, unit and value shown for seconds."""
+
+        abs_seconds: int = abs(seconds)
+
+        for unit, secs_per_unit in TIMEDELTA_UNITS:
+            value: float = abs_seconds / secs_per_unit
+
+            if value >= THRESHOLD or unit == GRANULARITY:
+                if unit == GRANULARITY and value > 0:
+                    value = max(1, value)
+
+                return seconds >= 0, unit, round(value)
+
+        return seconds >= 0, GRANULARITY, 0
+
+    # ------------------------------------------------------
+    def format(self, seconds: int) -> str:
+        """Format seconds relative to now, like "in 3 days" or "2 hours ago"."""
+
+        future, unit, value = self.get_unit_value(seconds)
+
+        if (plural_form := self.plural_forms.get(value)) is None:
+            plural_form = self.plural_forms[value] = self.locale.plural_form(value)
+
+        key: tuple[bool, str, str] = (future, unit, plural_form)
+
+        if (pattern := self.resolved.get(key)) is None:
+            pattern = ""
+
+            for patterns in self.patterns[future, unit]:
+                if pattern := patterns.get(plural_form) or patterns.get("other", ""):
+                    break
+
+            self.resolved[key] = pattern
+
+        return pattern.replace("{0}", str(value))
+
+    # ------------------------------------------------------
+    def next_change(self, seconds: int) -> int:
+        """Get the next seconds value, counting down, with another text."""
+
+        current: tuple[bool, str, int] = self.get_unit_value(seconds)
+        step: int = 1
+
+        while self.get_unit_value(seconds - step) == current:
+            step *= 2
+
+        changed: int = seconds - step
+        unchanged: int = seconds - step // 2
+
+        while unchanged - changed > 1:
+            middle: int = (changed + unchanged) // 2
+
+            if self.get_unit_value(middle) == current:
+                unchanged = middle
+            else:
+                changed = middle
+
+        return changed
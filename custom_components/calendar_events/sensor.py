@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from functools import cached_property
 from typing import Any
 
@@ -11,7 +11,7 @@ import voluptuous as vol
 from homeassistant.components.fan import FanEntityFeature
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, ServiceCall, State
+from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
 from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
@@ -24,7 +24,8 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .calendar_handler import CalendarHandler
 from .const import (
-    CONF_CALENDAR_ENTITY_IDS,
+    ATTR_EVENTS,
+    ATTR_MARKDOWN_TEXT,
     CONF_MAX_EVENTS,
     CONF_SHOW_EVENT_AS_TIME_TO,
     CONF_USE_SUMMARY_AS_ENTITY_NAME,
@@ -34,6 +35,9 @@ from .const import (
     TRANSLATION_KEY,
     TRANSLATION_KEY_MISSING_ENTITY,
 )
+from .refresh_gate import RefreshGate
+from .refresh_scheduler import RefreshScheduler
+from .snapshot_store import SnapshotStore
 
 
 # ------------------------------------------------------
@@ -44,13 +48,16 @@ async def async_setup_entry(
 ) -> None:
     """Sensor setup."""
 
-    registry = er.async_get(hass)
-    calendar_entities = er.async_validate_entity_ids(
-        registry, entry.options[CONF_CALENDAR_ENTITY_IDS]
-    )
+    calendar_entities: list[str] = hass.data[DOMAIN][entry.entry_id][
+        "calendar_entities"
+    ]
 
     if len(calendar_entities) > 0:
-        entry_options: dict[str, Any] = entry.options.copy()
+        # Shared with the calendar handler, so options changed in place are
+        # seen by both
+        entry_options: dict[str, Any] = hass.data[DOMAIN][entry.entry_id][
+            "calendar_handler"
+        ].entry_options
 
         tt: list[BaseCalendarEventSensor] = []
 
@@ -72,6 +79,7 @@ async def async_setup_entry(
                 entry_options,
                 calendar_entities,
                 tt,
+                async_add_entities,
             ),
             *tt,
         ]
@@ -85,6 +93,36 @@ class BaseCalendarEventSensor:
     """Base sensor class for calendar events."""
 
     entry_options: dict[str, Any] = {}
+    calendar_handler: CalendarHandler
+    state_fingerprint: tuple | None = None
+
+    # ------------------------------------------------------
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write state only when state or attributes changed."""
+
+        fingerprint: tuple = (
+            self.name,
+            self.native_value,
+            self.available,
+            self.get_attributes_fingerprint(),
+        )
+
+        if fingerprint == self.state_fingerprint:
+            self.calendar_handler.suppressed_writes += 1
+            return
+
+        self.state_fingerprint = fingerprint
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    def get_attributes_fingerprint(self) -> tuple:
+        """Get the values the extra state attributes are created from.
+
+        Cheaper to compare than the attributes themselves.
+        """
+
+        return ()
 
     # ------------------------------------------------------
     async def async_refresh(self) -> None:
@@ -100,6 +138,8 @@ class BaseCalendarEventSensor:
 class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
     """Sensor class for calendar events."""
 
+    _unrecorded_attributes = frozenset({ATTR_EVENTS, ATTR_MARKDOWN_TEXT})
+
     # ------------------------------------------------------
     def __init__(
         self,
@@ -108,6 +148,7 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
         entry_options: dict[str, Any],
         calendar_entities: list[str],
         events_sensors: list[BaseCalendarEventSensor],
+        async_add_entities: AddEntitiesCallback,
     ) -> None:
         """Calendar events sensor."""
 
@@ -117,10 +158,9 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
 
         self.calendar_entities: list[str] = calendar_entities
         self.events_sensors: list[CalendarEventsSensor] = events_sensors
+        self.async_add_entities: AddEntitiesCallback = async_add_entities
 
         self.translation_key = TRANSLATION_KEY
-        self.markdown_text: str = ""
-        self.events_json: dict = {}
 
         self.coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
             "coordinator"
@@ -128,9 +168,37 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
         self.calendar_handler: CalendarHandler = hass.data[DOMAIN][entry.entry_id][
             "calendar_handler"
         ]
+        self.snapshot_store: SnapshotStore = hass.data[DOMAIN][entry.entry_id][
+            "snapshot_store"
+        ]
+        self.refresh_gate: RefreshGate = hass.data[DOMAIN][entry.entry_id][
+            "refresh_gate"
+        ]
+
+        # Restored from the snapshot until the first refresh. When events
+        # have ended since the snapshot, the markdown is rendered again from
+        # the remaining events.
+        self.markdown_text: str = self.snapshot_store.markdown_text
+
+        if len(self.calendar_handler.events) != len(self.snapshot_store.events):
+            self.markdown_text = self.calendar_handler.create_markdown()
+        self.events_json: list[dict[str, Any]] = (
+            self.calendar_handler.create_events_attribute()
+        )
+        self.events_key: tuple = tuple(
+            event.render_key for event in self.calendar_handler.events
+        )
+        self.snapshot_key: tuple = self.get_snapshot_key(self.markdown_text)
 
         self.coordinator.update_method = self.async_refresh
-        self.coordinator.update_interval = timedelta(minutes=1)
+        self.refresh_scheduler: RefreshScheduler = RefreshScheduler(
+            hass,
+            self.coordinator,
+            self.refresh_gate,
+            self.calendar_handler,
+            hass.data[DOMAIN][entry.entry_id]["range_cache"],
+            self.calendar_entities,
+        )
 
         self.platform: EntityPlatform = entity_platform.async_get_current_platform()
 
@@ -162,28 +230,94 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
         if service_data.data.get(SERVICE_SAVE_SETTINGS, False):
             self.update_settings()
 
-        await self.coordinator.async_refresh()
+        await self.refresh_gate.async_refresh()
 
     # ------------------------------------------------------------------
     def update_settings(self) -> None:
         """Update config."""
 
         self.hass.config_entries.async_update_entry(
-            self.entry, data=self.entry_options, options=self.entry_options
+            self.entry, data=dict(self.entry_options), options=dict(self.entry_options)
         )
 
     # ------------------------------------------------------------------
     async def async_refresh(self) -> None:
         """Refresh."""
-        await self.calendar_handler.get_process_calendar_events(
-            self.calendar_entities, True
+        await self.calendar_handler.get_process_calendar_events(self.calendar_entities)
+        await self.calendar_handler.async_format_events()
+        self.async_resize_events_sensors()
+
+        markdown_text: str = self.calendar_handler.create_markdown()
+        events_key: tuple = tuple(
+            event.render_key for event in self.calendar_handler.events
+        )
+
+        snapshot_key: tuple = self.get_snapshot_key(markdown_text)
+
+        if snapshot_key != self.snapshot_key:
+            self.snapshot_store.async_save(self.calendar_handler.events, markdown_text)
+
+        self.markdown_text = markdown_text
+        self.events_key = events_key
+        self.snapshot_key = snapshot_key
+        self.events_json = self.calendar_handler.create_events_attribute()
+
+    # ------------------------------------------------------
+    def get_snapshot_key(self, markdown_text: str) -> tuple:
+        """Get the key that changes when the snapshot should be saved."""
+
+        if (
+            self.entry_options.get(CONF_SHOW_EVENT_AS_TIME_TO, False)
+            or self.calendar_handler.uses_time_or_states()
+        ):
+            markdown_text = ""
+
+        return (
+            tuple(event.identity_key for event in self.calendar_handler.events),
+            markdown_text,
         )
 
-        for event_sensor in self.events_sensors:
-            await event_sensor.async_refresh()
+    # ------------------------------------------------------
+    def get_attributes_fingerprint(self) -> tuple:
+        """Get the values the extra state attributes are created from.
+
+        The events attribute is created from the render keys of the events.
+        """
 
-        self.markdown_text = self.calendar_handler.create_markdown()
-        self.events_json = self.calendar_handler.events
+        return (self.markdown_text, self.events_key)
+
+    # ------------------------------------------------------
+    @callback
+    def async_resize_events_sensors(self) -> None:
+        """Add or remove event sensors when max events changed.
+
+        Remaining event sensors are kept as they are.
+        """
+
+        max_events: int = int(self.entry_options.get(CONF_MAX_EVENTS, 5))
+
+        if len(self.events_sensors) < max_events:
+            new_sensors: list[CalendarEventsSensor] = [
+                CalendarEventsSensor(
+                    self.hass,
+                    self.entry,
+                    self.entry_options,
+                    self.calendar_entities,
+                    x,
+                )
+                for x in range(len(self.events_sensors), max_events)
+            ]
+            self.events_sensors.extend(new_sensors)
+            self.async_add_entities(new_sensors)
+
+        while len(self.events_sensors) > max_events:
+            event_sensor: CalendarEventsSensor = self.events_sensors.pop()
+
+            # A sensor still being added is removed once its add completes
+            if event_sensor.added:
+                event_sensor.async_remove_sensor()
+            else:
+                event_sensor.remove_when_added = True
 
     # ------------------------------------------------------
     async def async_will_remove_from_hass(self) -> None:
@@ -192,27 +326,25 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
     # ------------------------------------------------------
     async def async_update(self) -> None:
         """Update the entity. Only used by the generic entity update service."""
-        await self.coordinator.async_request_refresh()
+        await self.refresh_gate.async_refresh(fetch=True)
 
     # ------------------------------------------------------
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
 
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state_if_changed)
         )
 
         self.async_on_remove(start.async_at_started(self.hass, self.async_hass_started))
+        self.async_on_remove(self.refresh_scheduler.async_stop)
 
     # ------------------------------------------------------
     async def async_hass_started(self, _event: Event) -> None:
         """Hass started."""
 
-        await self.calendar_handler.get_process_calendar_events(
-            self.calendar_entities, True
-        )
-        self.async_schedule_update_ha_state()
-        await self.coordinator.async_refresh()
+        await self.refresh_gate.async_refresh(fetch=True)
+        self.refresh_scheduler.async_start()
 
     # ------------------------------------------------------
     @property
@@ -260,8 +392,8 @@ class CalendarEventSensor(SensorEntity, BaseCalendarEventSensor):
         """
 
         attr: dict = {}
-        attr["events"] = self.events_json
-        attr["markdown_text"] = self.markdown_text
+        attr[ATTR_EVENTS] = self.events_json
+        attr[ATTR_MARKDOWN_TEXT] = self.markdown_text
         return attr
 
     # ------------------------------------------------------------------
@@ -348,22 +480,61 @@ class CalendarEventsSensor(SensorEntity, BaseCalendarEventSensor):
         self.calendar_handler: CalendarHandler = hass.data[DOMAIN][entry.entry_id][
             "calendar_handler"
         ]
+        self.coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+            "coordinator"
+        ]
 
         self.event_num = event_num
 
         self.translation_key = TRANSLATION_KEY
 
-        self.formated_event: str = ""
+        self.formated_event: str | None = ""
+        self.added: bool = False
+        self.remove_when_added: bool = False
+
+        # Restored from the snapshot until the first refresh
+        if self.event_num < len(self.calendar_handler.events):
+            self.formated_event = self.calendar_handler.events[
+                self.event_num
+            ].formatted_event
 
     # ------------------------------------------------------------------
-    async def async_refresh(self) -> None:
-        """Refresh."""
-        self.formated_event = await self.calendar_handler.async_format_event(
-            self.event_num
+    @callback
+    def async_handle_coordinator_update(self) -> None:
+        """Publish the formatted event after a refresh."""
+        self.formated_event = None
+
+        if self.event_num < len(self.calendar_handler.events):
+            self.formated_event = self.calendar_handler.events[
+                self.event_num
+            ].formatted_event
+
+        self.async_write_ha_state_if_changed()
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_handle_coordinator_update)
         )
+        self.added = True
+
+        if self.remove_when_added:
+            self.async_remove_sensor()
+
+    # ------------------------------------------------------
+    @callback
+    def async_remove_sensor(self) -> None:
+        """Remove the sensor and its registry entry."""
+
+        registry: er.EntityRegistry = er.async_get(self.hass)
 
-        if self.entity_id is not None:
-            self.async_write_ha_state()
+        # Removing the registry entry also removes the entity
+        if registry.async_get(self.entity_id) is not None:
+            registry.async_remove(self.entity_id)
+        else:
+            self.hass.async_create_task(self.async_remove())
 
     # ------------------------------------------------------
     async def async_will_remove_from_hass(self) -> None:
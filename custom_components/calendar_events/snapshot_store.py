@@ -0,0 +1,76 @@
+"""Snapshot store for Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .calendar_handler import CalendarEvent
+from .const import DOMAIN, LOGGER, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class SnapshotStore:
+    """Persistent snapshot of the processed events and rendered markdown."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Init."""
+
+        self.store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self.events: list[CalendarEvent] = []
+        self.markdown_text: str = ""
+        self.saved: datetime | None = None
+
+    # ------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load the snapshot."""
+
+        try:
+            data: dict[str, Any] | None = await self.store.async_load()
+
+            if data is None:
+                return
+
+            self.events = [CalendarEvent.from_dict(event) for event in data["events"]]
+            self.markdown_text = data["markdown_text"]
+            self.saved = dt_util.parse_datetime(data["saved"])
+        # A snapshot that can not be read is ignored, the next refresh replaces it
+        except Exception as err:  # noqa: BLE001
+            LOGGER.error(err)
+            self.events = []
+            self.markdown_text = ""
+
+    # ------------------------------------------------------
+    @callback
+    def async_save(self, events: list[CalendarEvent], markdown_text: str) -> None:
+        """Save a snapshot after SNAPSHOT_SAVE_DELAY seconds."""
+
+        self.events = events
+        self.markdown_text = markdown_text
+        self.store.async_delay_save(self.data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    # ------------------------------------------------------
+    @callback
+    def data_to_save(self) -> dict[str, Any]:
+        """Data to save."""
+
+        self.saved = dt_util.utcnow()
+
+        return {
+            "saved": self.saved.isoformat(),
+            "events": [event.as_dict() for event in self.events],
+            "markdown_text": self.markdown_text,
+        }
+
+    # ------------------------------------------------------
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+
+        await self.store.async_remove()
@@ -0,0 +1,90 @@
+"""Tests for the columnar event store of Calendar events helper."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+import random
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.calendar_events.columnar_store import ColumnarEvents
+from custom_components.calendar_events.event_index import (
+    get_epoch_key,
+    parse_event_datetime,
+)
+
+LOCAL_TIME_ZONE = ZoneInfo("Europe/Copenhagen")
+SUMMARIES = ["Standup", "Lunch", "Gym"]
+
+
+# ------------------------------------------------------
+@pytest.fixture(autouse=True)
+def local_time_zone() -> Iterator[None]:
+    """Use a local time zone with daylight saving time."""
+
+    dt_util.set_default_time_zone(LOCAL_TIME_ZONE)
+    yield
+    dt_util.set_default_time_zone(dt_util.UTC)
+
+
+# ------------------------------------------------------
+def create_raw_event(rnd: random.Random, first_day: int, days: int) -> dict[str, Any]:
+    """Create a raw all day or timed event likely to share a series."""
+
+    start: datetime = datetime(2024, 10, 20) + timedelta(
+        days=rnd.randint(first_day, first_day + days), hours=rnd.choice([8, 12])
+    )
+
+    if rnd.random() < 0.2:
+        return {
+            "start": start.date().isoformat(),
+            "end": (start.date() + timedelta(days=rnd.randint(1, 3))).isoformat(),
+            "summary": rnd.choice(SUMMARIES),
+        }
+
+    return {
+        "start": start.isoformat(),
+        "end": (start + timedelta(hours=rnd.randint(1, 30))).isoformat(),
+        "summary": rnd.choice(SUMMARIES),
+    }
+
+
+# ------------------------------------------------------
+@pytest.mark.parametrize("seed", range(50))
+def test_extend_matches_new_store(seed: int) -> None:
+    """Test extending a store gives the same events as building it again."""
+
+    rnd = random.Random(seed)
+    base: list[dict[str, Any]] = [
+        create_raw_event(rnd, 0, 10) for _ in range(rnd.randint(0, 80))
+    ]
+    store = ColumnarEvents("Calendar", base)
+
+    for step in range(1, 6):
+        start_key: int = get_epoch_key(
+            datetime(2024, 10, 20, tzinfo=LOCAL_TIME_ZONE) + timedelta(days=step)
+        )
+        tail: list[dict[str, Any]] = [
+            create_raw_event(rnd, 10 + step, 1) for _ in range(rnd.randint(0, 10))
+        ]
+        events: list[dict[str, Any]] = [
+            item
+            for item in store.events
+            if get_epoch_key(parse_event_datetime(item["end"])) > start_key
+        ] + tail
+
+        store = store.extend(events, start_key, tail)
+        expected = ColumnarEvents("Calendar", events)
+
+        assert store.rows.tolist() == expected.rows.tolist()
+
+        for remove_recurring in (False, True):
+            assert list(
+                store.iter_items(start_key, start_key + 10**11, remove_recurring)
+            ) == list(
+                expected.iter_items(start_key, start_key + 10**11, remove_recurring)
+            )
@@ -0,0 +1,136 @@
+"""Tests for the epoch keys and interval index of Calendar events helper."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta, timezone
+import random
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.calendar_events.calendar_handler import CalendarEvent
+from custom_components.calendar_events.event_index import (
+    EventIntervalIndex,
+    get_epoch_key,
+)
+from custom_components.calendar_events.event_pipeline import filter_window
+
+LOCAL_TIME_ZONE = ZoneInfo("Europe/Copenhagen")
+OFFSETS = [timezone(timedelta(hours=hours)) for hours in (-5, 0, 2, 9)]
+
+
+# ------------------------------------------------------
+@pytest.fixture(autouse=True)
+def local_time_zone() -> Iterator[None]:
+    """Use a local time zone with daylight saving time."""
+
+    dt_util.set_default_time_zone(LOCAL_TIME_ZONE)
+    yield
+    dt_util.set_default_time_zone(dt_util.UTC)
+
+
+# ------------------------------------------------------
+def create_value(rnd: random.Random, value: datetime) -> str:
+    """Create a timed value, naive or with a random offset."""
+
+    if rnd.random() < 0.3:
+        return value.isoformat()
+
+    return (
+        value.replace(tzinfo=LOCAL_TIME_ZONE)
+        .astimezone(rnd.choice(OFFSETS))
+        .isoformat()
+    )
+
+
+# ------------------------------------------------------
+def create_raw_event(rnd: random.Random) -> dict[str, Any]:
+    """Create a raw all day, naive or offset event.
+
+    Times are on a coarse grid, so events in different offsets often start
+    at the same instant.
+    """
+
+    # Around the daylight saving time change on October 27
+    start: datetime = datetime(2024, 10, 20) + timedelta(hours=rnd.randint(0, 14 * 24))
+
+    if rnd.random() < 0.25:
+        return {
+            "start": start.date().isoformat(),
+            "end": (start.date() + timedelta(days=rnd.randint(1, 3))).isoformat(),
+            "summary": "All day",
+        }
+
+    end: datetime = start + timedelta(hours=rnd.randint(0, 30))
+
+    return {
+        "start": create_value(rnd, start),
+        "end": create_value(rnd, end),
+        "summary": "Timed",
+    }
+
+
+# ------------------------------------------------------
+def parse_reference(value: str) -> datetime:
+    """Parse a raw value to an aware datetime, without epoch keys."""
+
+    if len(value) == 10:
+        return datetime.combine(date.fromisoformat(value), time(), LOCAL_TIME_ZONE)
+
+    parsed: datetime = datetime.fromisoformat(value)
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=LOCAL_TIME_ZONE)
+
+    return parsed
+
+
+# ------------------------------------------------------
+def create_query_bound(rnd: random.Random) -> datetime:
+    """Create a query bound in a random offset."""
+
+    return (
+        datetime(2024, 10, 19, tzinfo=LOCAL_TIME_ZONE)
+        + timedelta(minutes=30 * rnd.randint(0, 17 * 48))
+    ).astimezone(rnd.choice(OFFSETS))
+
+
+# ------------------------------------------------------
+@pytest.mark.parametrize("seed", range(100))
+def test_epoch_keys_match_reference(seed: int) -> None:
+    """Test sorting, window filtering and range queries against datetimes."""
+
+    rnd = random.Random(seed)
+    raw_events: list[dict[str, Any]] = [
+        create_raw_event(rnd) for _ in range(rnd.randint(0, 80))
+    ]
+    events: list[CalendarEvent] = [
+        CalendarEvent.from_response("Calendar", event) for event in raw_events
+    ]
+    reference: dict[int, tuple[datetime, datetime]] = {
+        id(event): (parse_reference(raw["start"]), parse_reference(raw["end"]))
+        for event, raw in zip(events, raw_events, strict=True)
+    }
+
+    ordered: list[CalendarEvent] = sorted(events, key=lambda x: x.start_key)
+    assert ordered == sorted(events, key=lambda x: reference[id(x)][0])
+
+    for _ in range(10):
+        start: datetime = create_query_bound(rnd)
+        end: datetime = start + timedelta(hours=rnd.randint(0, 7 * 24))
+        expected: list[CalendarEvent] = [
+            event
+            for event in ordered
+            if reference[id(event)][1] > start and reference[id(event)][0] < end
+        ]
+
+        assert (
+            list(filter_window(iter(ordered), get_epoch_key(start), get_epoch_key(end)))
+            == expected
+        )
+        assert [
+            event for event, _ in EventIntervalIndex(events).query_events(start, end)
+        ] == expected
@@ -0,0 +1,100 @@
+"""Tests for the event pipeline of Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.calendar_events.calendar_handler import CalendarEvent
+from custom_components.calendar_events.event_pipeline import remove_recurring_events
+
+CALENDARS = ["Work", "Home"]
+SUMMARIES = ["Standup", "Lunch", "Gym"]
+DESCRIPTIONS = ["", "Room 1"]
+TIMES = ["08:00:00", "08:00:00+02:00", "12:30:00", "12:30:00-05:00"]
+
+
+# ------------------------------------------------------
+def create_raw_event(rnd: random.Random) -> dict[str, Any]:
+    """Create a raw event likely to share a series with other events."""
+
+    day: datetime = datetime(2024, 7, 1) + timedelta(days=rnd.randint(0, 20))
+
+    if rnd.random() < 0.2:
+        return {
+            "start": day.date().isoformat(),
+            "end": (day + timedelta(days=1)).date().isoformat(),
+            "summary": rnd.choice(SUMMARIES),
+            "description": rnd.choice(DESCRIPTIONS),
+        }
+
+    return {
+        "start": f"{day.date().isoformat()}T{rnd.choice(TIMES)}",
+        "end": f"{day.date().isoformat()}T{rnd.choice(TIMES)}",
+        "summary": rnd.choice(SUMMARIES),
+        "description": rnd.choice(DESCRIPTIONS),
+    }
+
+
+# ------------------------------------------------------
+def remove_recurring_events_nested_loop(
+    events: list[tuple[str, dict[str, Any]]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Remove recurring events the way the handler used to.
+
+    Every event is compared with every later event, on the raw start and
+    end values.
+    """
+
+    events = list(events)
+    index: int = 0
+
+    while index < (len(events) - 1):
+        for index2, _ in reversed(list(enumerate(events))):
+            if index2 <= index:
+                break
+            if (
+                events[index][0] == events[index2][0]
+                and events[index][1]["summary"] == events[index2][1]["summary"]
+                and events[index][1]["description"] == events[index2][1]["description"]
+                and datetime.fromisoformat(events[index][1]["start"]).time()
+                == datetime.fromisoformat(events[index2][1]["start"]).time()
+                and datetime.fromisoformat(events[index][1]["end"]).time()
+                == datetime.fromisoformat(events[index2][1]["end"]).time()
+            ):
+                del events[index2]
+        index += 1
+
+    return events
+
+
+# ------------------------------------------------------
+@pytest.mark.parametrize("seed", range(100))
+def test_remove_recurring_events_matches_nested_loop(seed: int) -> None:
+    """Test the single pass keeps the same events as the nested loop."""
+
+    rnd = random.Random(seed)
+    raw_events: list[tuple[str, dict[str, Any]]] = [
+        (rnd.choice(CALENDARS), create_raw_event(rnd))
+        for _ in range(rnd.randint(0, 60))
+    ]
+
+    expected: list[tuple[str, dict[str, Any]]] = remove_recurring_events_nested_loop(
+        raw_events
+    )
+    events: list[CalendarEvent] = list(
+        remove_recurring_events(
+            iter(
+                CalendarEvent.from_response(calendar, event)
+                for calendar, event in raw_events
+            )
+        )
+    )
+
+    assert [event.render_key for event in events] == [
+        CalendarEvent.from_response(calendar, event).render_key
+        for calendar, event in expected
+    ]
@@ -0,0 +1,69 @@
+"""Tests for the relative time of Calendar events helper."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import random
+
+from babel import Locale
+from babel.dates import format_timedelta
+import pytest
+
+from custom_components.calendar_events.relative_time import RelativeTimeFormatter
+
+LOCALES = ["en", "da", "de", "fr", "ru", "ar", "ja"]
+
+
+# ------------------------------------------------------
+def create_seconds(rnd: random.Random) -> list[int]:
+    """Create seconds around every unit, in both directions."""
+
+    seconds: list[int] = [0, 1, 59, 60, 61, 3599, 3600, 86399, 86400]
+
+    for scale in (60, 3600, 86400, 7 * 86400, 30 * 86400, 365 * 86400):
+        seconds.extend(rnd.randint(0, 3 * scale) for _ in range(20))
+
+    return seconds + [-value for value in seconds]
+
+
+# ------------------------------------------------------
+@pytest.mark.parametrize("language", LOCALES)
+def test_format_matches_babel(language: str) -> None:
+    """Test the text matches babel format_timedelta with direction."""
+
+    locale: Locale = Locale.parse(language)
+    formatter = RelativeTimeFormatter(locale)
+
+    for seconds in create_seconds(random.Random(language)):
+        assert formatter.format(seconds) == format_timedelta(
+            timedelta(seconds=seconds), add_direction=True, locale=locale
+        ), seconds
+
+
+# ------------------------------------------------------
+@pytest.mark.parametrize("language", LOCALES)
+def test_next_change_is_first_other_text(language: str) -> None:
+    """Test the text changes at next change and not before, counting down."""
+
+    locale: Locale = Locale.parse(language)
+    formatter = RelativeTimeFormatter(locale)
+
+    for seconds in create_seconds(random.Random(language)):
+        next_change: int = formatter.next_change(seconds)
+        text: str = format_timedelta(
+            timedelta(seconds=seconds), add_direction=True, locale=locale
+        )
+
+        assert next_change < seconds
+        assert (
+            format_timedelta(
+                timedelta(seconds=next_change + 1), add_direction=True, locale=locale
+            )
+            == text
+        ), seconds
+        assert (
+            format_timedelta(
+                timedelta(seconds=next_change), add_direction=True, locale=locale
+            )
+            != text
+        ), seconds